@@ -4,41 +4,196 @@ Drop a video idea in Google Sheets and automatically generate, upload, and log Y
 """
 
 import os
+import sys
 import time
+import asyncio
+import sqlite3
 import json
-from datetime import datetime
-from typing import Dict, Optional, List
+import hashlib
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Set
 import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson  # Optional, faster JSON parsing
+except ImportError:
+    orjson = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('video_automation.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Fixed description prefix, kept byte-stable across videos
+_DESC_PREFIX = sys.intern("Generated video about: ")
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Check whether a failed pipeline step is worth retrying
+    
+    Args:
+        error: Exception raised by the step
+        
+    Returns:
+        True for server-side and rate-limit API errors and network
+        failures; False for errors a retry can't fix, such as invalid
+        input, missing files, or quota and auth failures
+    """
+    # Imported here like the handlers themselves; all are loaded by the
+    # time a step can fail
+    import anthropic
+    import openai
+    from googleapiclient.errors import HttpError
+    from youtube_uploader import RETRIABLE_STATUS_CODES
+    
+    if isinstance(error, (openai.APIConnectionError, openai.RateLimitError,
+                          openai.InternalServerError, anthropic.APIConnectionError,
+                          anthropic.RateLimitError, anthropic.InternalServerError)):
+        return True
+    if isinstance(error, HttpError):
+        return error.resp.status in RETRIABLE_STATUS_CODES
+    if isinstance(error, (FileNotFoundError, PermissionError, IsADirectoryError)):
+        return False
+    return isinstance(error, (OSError, http.client.HTTPException))
+
+
+def _request_key(topic: str, prompts: str) -> str:
+    """Hash identifying a video request by its content"""
+    return hashlib.blake2b(f"{topic}\0{prompts}".encode(), digest_size=16).hexdigest()
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class VideoResult:
+    """Outcome of processing a single video request"""
+    
+    id: str
+    topic: str
+    status: str = 'pending'
+    error: Optional[str] = None
+    video_url: Optional[str] = None
+    video_file: Optional[str] = None
+    youtube_url: Optional[str] = None
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Formatted when written to Sheets
+    music_file: Optional[str] = None
+    intro_file: Optional[str] = None
+    youtube_id: Optional[str] = None
+    
+    def to_row(self) -> Dict:
+        """Convert to a dictionary for writing to Google Sheets"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def _configure_logging():
+    """Configure logging unless the application already has"""
+    if logging.getLogger().handlers:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler('video_automation.log'), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Worker threads only enqueue records; a listener thread does the I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
 
 class AutoVideoGenerator:
     """Main orchestrator for automated video generation workflow"""
     
+    # Flush buffered Sheets rows once this many results are queued
+    FLUSH_THRESHOLD = 25
+    
     def __init__(self, config_path: str = "config.json"):
         """Initialize the video generator with configuration"""
+        _configure_logging()
         self.config = self.load_config(config_path)
         self.sheets_handler = None
         self.video_generator = None
         self.youtube_uploader = None
         
+        # Flatten config values read on every video or retry
+        self._input_sheet = self.config['google_sheets']['input_sheet']
+        self._output_sheet = self.config['google_sheets']['output_sheet']
+        self._yt_category = self.config['youtube']['default_category']
+        self._yt_privacy = self.config['youtube']['privacy_status']
+        self._max_retries = self.config['error_handling']['max_retries']
+        self._retry_delay = self.config['error_handling']['retry_delay']
+        concurrency_config = self.config.get('concurrency', {})
+        self._workers = concurrency_config.get('workers', 4)
+        
+        # The Sheets client is not thread-safe; serialize access across workers
+        self._sheets_lock = threading.Lock()
+        # Bound concurrent uploads across workers to stay within API quota
+        self._upload_slots = threading.Semaphore(
+            concurrency_config.get('max_concurrent_uploads', 2)
+        )
+        # Rows buffered for Sheets, written by flush_sheets
+        self._pending_output: List[Dict] = []
+        self._pending_errors: List[Dict] = []
+        
+        # Local index of completed videos, used to skip them on later runs
+        state_config = self.config.get('state', {})
+        self._db = sqlite3.connect(
+            state_config.get('db_path', 'video_state.db'),
+            isolation_level=None,  # Autocommit
+            check_same_thread=False  # Guarded by _sheets_lock
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS done ("
+            "id TEXT PRIMARY KEY, topic TEXT, youtube_id TEXT, ts INTEGER, request_key TEXT)"
+        )
+        done_columns = {row[1] for row in self._db.execute("PRAGMA table_info(done)")}
+        if 'request_key' not in done_columns:
+            self._db.execute("ALTER TABLE done ADD COLUMN request_key TEXT")
+        # First input row that still needs reading; everything above is
+        # completed, and the row just above holds last_id
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS watermark ("
+            "sheet TEXT PRIMARY KEY, next_row INTEGER, last_id TEXT)"
+        )
+        watermark_columns = {row[1] for row in self._db.execute("PRAGMA table_info(watermark)")}
+        if 'last_id' not in watermark_columns:
+            self._db.execute("ALTER TABLE watermark ADD COLUMN last_id TEXT")
+        
+        # Content-addressed cache of generated music and intro assets
+        cache_config = self.config.get('cache', {})
+        self._cache_enabled = cache_config.get('enabled', True)
+        self._cache_max_entries = cache_config.get('max_entries', 50)
+        self._asset_cache_dir = Path(cache_config.get('dir', 'output_videos/.cache'))
+        self._cache_index_path = self._asset_cache_dir / 'cache_index.json'
+        self._cache_lock = threading.Lock()
+        self._cache_index = self._load_cache_index()
+        # Entries handed out or stored during the current run; their files
+        # may be inputs to renders still in progress, so they are not evicted
+        self._cache_in_use: Set[str] = set()
+        
     def load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file"""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
         except FileNotFoundError:
-            logger.warning(f"Config file not found at {config_path}, using defaults")
+            logger.warning("Config file not found at %s, using defaults", config_path)
             return self.get_default_config()
     
     def get_default_config(self) -> Dict:
@@ -54,16 +209,31 @@ class AutoVideoGenerator:
                 "ai_provider": "openai",  # or "anthropic", "elevenlabs", etc.
                 "video_duration": 60,
                 "resolution": "1920x1080",
-                "fps": 30
+                "fps": 30,
+                "script_batch_size": 10,  # Scripts requested per AI call
+                "scene_batch_size": 4  # Scenes encoded per FFmpeg process
             },
             "youtube": {
                 "client_secrets_file": "client_secrets.json",
                 "default_category": "22",  # People & Blogs
-                "privacy_status": "private"  # or "public", "unlisted"
+                "privacy_status": "private",  # or "public", "unlisted"
+                "upload_chunk_size": 8 * 1024 * 1024  # Resumable upload chunk size, a multiple of 256 KiB
             },
             "error_handling": {
                 "max_retries": 3,
                 "retry_delay": 5
+            },
+            "concurrency": {
+                "workers": 4,  # Number of videos processed in parallel
+                "max_concurrent_uploads": 2
+            },
+            "state": {
+                "db_path": "video_state.db"  # SQLite index of completed videos
+            },
+            "cache": {
+                "enabled": True,
+                "dir": "output_videos/.cache",
+                "max_entries": 50  # Least recently used assets are evicted
             }
         }
     
@@ -83,10 +253,11 @@ class AutoVideoGenerator:
         )
         
         self.youtube_uploader = YouTubeUploader(
-            self.config['youtube']['client_secrets_file']
+            self.config['youtube']['client_secrets_file'],
+            chunk_size=self.config['youtube'].get('upload_chunk_size')
         )
     
-    def process_video_request(self, row_data: Dict) -> Dict:
+    def process_video_request(self, row_data: Dict) -> VideoResult:
         """
         Process a single video request from Google Sheets
         
@@ -94,140 +265,545 @@ class AutoVideoGenerator:
             row_data: Dictionary containing video topic and prompts
             
         Returns:
-            Dictionary with processing results
+            VideoResult with processing results
         """
-        video_id = row_data.get('id', str(int(time.time())))
+        now_ns = time.time_ns()
+        video_id = row_data.get('id') or str(now_ns // 1_000_000_000)
         topic = row_data.get('topic', '')
         prompts = row_data.get('prompts', '')
         
-        logger.info(f"Processing video request: {topic}")
-        
-        result = {
-            'id': video_id,
-            'topic': topic,
-            'status': 'pending',
-            'error': None,
-            'video_url': None,
-            'video_file': None,
-            'youtube_url': None,
-            'timestamp': datetime.now().isoformat()
-        }
+        logger.info("Processing video request: %s", topic)
+        
+        result = VideoResult(id=video_id, topic=topic, timestamp_ns=now_ns)
+        
+        # Let the batched script request for this video's group finish first,
+        # so the script comes from the cache instead of a request of its own
+        scripts_ready = row_data.get('scripts_ready')
+        if scripts_ready is not None:
+            try:
+                scripts_ready.result()
+            except Exception as e:
+                logger.warning("Batch script generation failed: %s", e)
         
         try:
             # Step 1: Get Music and Intro Video
             logger.info("Step 1: Generating music and intro video")
-            music_intro = self.video_generator.create_music_and_intro(topic, prompts)
-            result['music_file'] = music_intro.get('music_path')
-            result['intro_file'] = music_intro.get('intro_path')
+            music_intro = self._with_retry(
+                self._cached_music_and_intro, topic, prompts,
+                step_name="Music and intro generation"
+            )
+            result.music_file = music_intro.get('music_path')
+            result.intro_file = music_intro.get('intro_path')
             
             # Step 2: Generate Full Video
             logger.info("Step 2: Generating full video")
-            video_data = self.video_generator.generate_full_video(
+            video_data = self._with_retry(
+                self.video_generator.generate_full_video,
+                step_name="Full video generation",
                 topic=topic,
                 prompts=prompts,
                 music_path=music_intro.get('music_path'),
                 intro_path=music_intro.get('intro_path')
             )
-            result['video_file'] = video_data['video_path']
-            result['video_url'] = video_data.get('video_url')
+            result.video_file = video_data['video_path']
+            result.video_url = video_data.get('video_url')
             
             # Step 3: Upload to YouTube
             logger.info("Step 3: Uploading to YouTube")
-            youtube_result = self.youtube_uploader.upload_video(
+            youtube_result = self._with_retry(
+                self._upload_video,
+                step_name="YouTube upload",
+                # The uploader already retries each chunk; only start one
+                # fresh upload session after it gives up
+                max_retries=min(1, self._max_retries),
                 video_path=video_data['video_path'],
                 title=topic,
-                description=f"Generated video about: {topic}\n\n{prompts}",
-                category=self.config['youtube']['default_category'],
-                privacy_status=self.config['youtube']['privacy_status']
+                description="".join((_DESC_PREFIX, topic, "\n\n", prompts)),
+                category=self._yt_category,
+                privacy_status=self._yt_privacy
             )
-            result['youtube_url'] = youtube_result['url']
-            result['youtube_id'] = youtube_result['id']
+            result.youtube_url = youtube_result['url']
+            result.youtube_id = youtube_result['id']
             
-            result['status'] = 'completed'
-            logger.info(f"Video processing completed: {result['youtube_url']}")
+            result.status = 'completed'
+            logger.info("Video processing completed: %s", result.youtube_url)
             
         except Exception as e:
-            logger.error(f"Error processing video: {str(e)}", exc_info=True)
-            result['status'] = 'failed'
-            result['error'] = str(e)
+            logger.error("Error processing video: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            result.status = 'failed'
+            result.error = str(e)
             
-            # Handle errors with retry logic
-            result = self.handle_error(result, row_data)
+            result = self.handle_error(result, row_data, e)
         
         return result
     
-    def handle_error(self, result: Dict, row_data: Dict) -> Dict:
+    def _load_cache_index(self) -> Dict:
+        """Load the asset cache index from disk"""
+        if not self._cache_enabled or not self._cache_index_path.exists():
+            return {}
+        
+        try:
+            with open(self._cache_index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable cache index: %s", e)
+            return {}
+    
+    def _save_cache_index(self):
+        """Write the asset cache index to disk"""
+        try:
+            with open(self._cache_index_path, 'w') as f:
+                json.dump(self._cache_index, f, indent=2)
+        except OSError as e:
+            logger.warning("Failed to save cache index: %s", e)
+    
+    def _cached_music_and_intro(self, topic: str, prompts: str) -> Dict:
         """
-        Handle errors with retry logic
+        Generate music and intro, reusing assets made earlier for the same request
         
         Args:
-            result: Current result dictionary with error
-            row_data: Original row data
+            topic: Video topic
+            prompts: Additional prompts for customization
             
         Returns:
-            Updated result dictionary
+            Dictionary with paths to music and intro files
         """
-        max_retries = self.config['error_handling']['max_retries']
-        retry_count = row_data.get('retry_count', 0)
+        if not self._cache_enabled:
+            return self.video_generator.create_music_and_intro(topic, prompts)
+        
+        key = _request_key(topic, prompts)
+        music_cached = self._asset_cache_dir / f"{key}.music.mp3"
+        intro_cached = self._asset_cache_dir / f"{key}.intro.mp4"
+        
+        with self._cache_lock:
+            entry = self._cache_index.get(key)
+            if entry and music_cached.exists() and intro_cached.exists():
+                entry['last_used'] = time.time()
+                self._cache_in_use.add(key)
+                self._save_cache_index()
+                logger.info("Reusing cached music and intro for: %s", topic)
+                return {
+                    'music_path': str(music_cached),
+                    'intro_path': str(intro_cached)
+                }
+        
+        music_intro = self.video_generator.create_music_and_intro(topic, prompts)
+        music_path = music_intro.get('music_path')
+        intro_path = music_intro.get('intro_path')
+        
+        # Only cache complete results so a failed asset is regenerated next time
+        if not music_path or not intro_path:
+            return music_intro
+        
+        from video_generator import store_cached_file
         
-        if retry_count < max_retries:
-            logger.info(f"Retrying video generation (attempt {retry_count + 1}/{max_retries})")
-            time.sleep(self.config['error_handling']['retry_delay'])
+        with self._cache_lock:
+            try:
+                self._asset_cache_dir.mkdir(parents=True, exist_ok=True)
+                store_cached_file(music_path, music_cached)
+                store_cached_file(intro_path, intro_cached)
+            except OSError as e:
+                logger.warning("Failed to cache music and intro: %s", e)
+                return music_intro
             
-            # Update retry count and try again
-            row_data['retry_count'] = retry_count + 1
-            return self.process_video_request(row_data)
-        else:
-            logger.error(f"Max retries reached for video: {row_data.get('topic')}")
-            result['status'] = 'failed_max_retries'
+            self._cache_index[key] = {
+                'topic': topic,
+                'music_path': str(music_cached),
+                'intro_path': str(intro_cached),
+                'last_used': time.time()
+            }
             
-            # Log error to sheets
-            self.log_error(result)
+            self._cache_in_use.add(key)
             
+            # Evict least recently used entries not in use by this run; the
+            # cache may run over its limit until the next run frees them
+            excess = len(self._cache_index) - self._cache_max_entries
+            if excess > 0:
+                stale = sorted(
+                    (k for k in self._cache_index if k not in self._cache_in_use),
+                    key=lambda k: self._cache_index[k]['last_used']
+                )
+                for stale_key in stale[:excess]:
+                    stale_entry = self._cache_index.pop(stale_key)
+                    Path(stale_entry['music_path']).unlink(missing_ok=True)
+                    Path(stale_entry['intro_path']).unlink(missing_ok=True)
+            
+            self._save_cache_index()
+        
+        return music_intro
+    
+    def _upload_video(self, **kwargs) -> Dict:
+        """Upload a video to YouTube, waiting for a free upload slot"""
+        with self._upload_slots:
+            return self.youtube_uploader.upload_video(**kwargs)
+    
+    def _with_retry(self, fn: Callable, *args, step_name: str,
+                    max_retries: Optional[int] = None, **kwargs) -> Any:
+        """
+        Call a pipeline step, retrying it with exponential backoff on transient failures
+        
+        Other errors are raised immediately.
+        
+        Args:
+            fn: Step function to call
+            step_name: Step description used in log messages
+            max_retries: Retry limit for this step (default: from config)
+            
+        Returns:
+            Return value of the step function
+        """
+        if max_retries is None:
+            max_retries = self._max_retries
+        retry_delay = self._retry_delay
+        
+        for attempt in range(max_retries + 1):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= max_retries or not _is_transient(e):
+                    raise
+                delay = retry_delay * 2 ** attempt
+                logger.warning(
+                    "%s failed: %s. Retrying in %ss (attempt %d/%d)",
+                    step_name, e, delay, attempt + 1, max_retries
+                )
+                time.sleep(delay)
+    
+    def handle_error(self, result: VideoResult, row_data: Dict,
+                     error: Exception) -> VideoResult:
+        """
+        Handle a video whose failed step can't be retried any further
+        
+        Args:
+            result: Current result with error
+            row_data: Original row data
+            error: Exception that failed the step
+            
+        Returns:
+            Updated result, with status 'failed_max_retries' if the step was
+            retried until the limit, or 'failed' if the error wasn't retryable
+        """
+        if self._max_retries > 0 and _is_transient(error):
+            logger.error("Max retries reached for video: %s", row_data.get('topic'))
+            result.status = 'failed_max_retries'
+        else:
+            logger.error("Non-retryable error for video: %s", row_data.get('topic'))
+            result.status = 'failed'
+        
+        # Log error to sheets
+        self.log_error(result)
+        
         return result
     
-    def log_error(self, result: Dict):
-        """Log error to error tracking sheet"""
-        try:
-            error_data = {
-                'timestamp': result['timestamp'],
-                'video_id': result['id'],
-                'topic': result['topic'],
-                'error': result['error'],
-                'status': result['status']
+    def log_error(self, result: VideoResult):
+        """Queue error for the error tracking sheet"""
+        error_data = {
+            'timestamp_ns': result.timestamp_ns,
+            'video_id': result.id,
+            'topic': result.topic,
+            'error': result.error,
+            'status': result.status
+        }
+        with self._sheets_lock:
+            self._pending_errors.append(error_data)
+    
+    def mark_as_done(self, result: VideoResult, request_key: Optional[str] = None):
+        """
+        Queue video as completed for Google Sheets
+        
+        Args:
+            result: Result of processing the video
+            request_key: _request_key of the request, recorded for completed videos
+        """
+        with self._sheets_lock:
+            self._pending_output.append(result.to_row())
+            pending = len(self._pending_output)
+            if result.status == 'completed':
+                self._db.execute(
+                    "INSERT OR REPLACE INTO done (id, topic, youtube_id, ts, request_key) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (result.id, result.topic, result.youtube_id, result.timestamp_ns, request_key)
+                )
+        logger.info("Marked video as done: %s", result.id)
+        
+        if pending >= self.FLUSH_THRESHOLD:
+            self.flush_sheets()
+    
+    @staticmethod
+    def _to_sheet_row(row: Dict) -> Dict:
+        """Convert a queued row for Sheets, formatting its timestamp as UTC ISO 8601"""
+        sheet_row = {}
+        for key, value in row.items():
+            if key == 'timestamp_ns':
+                key = 'timestamp'
+                value = datetime.fromtimestamp(
+                    value // 1_000_000_000, tz=timezone.utc
+                ).isoformat()
+            sheet_row[key] = value
+        return sheet_row
+    
+    def flush_sheets(self):
+        """Write queued results, errors and status updates to Google Sheets"""
+        with self._sheets_lock:
+            try:
+                self.sheets_handler.flush_status_updates()
+            except Exception as e:
+                logger.error("Failed to update input row status: %s", e)
+            
+            batches = [
+                (self._output_sheet, self._pending_output),
+                ('Error Log', self._pending_errors)
+            ]
+            self._pending_output = []
+            self._pending_errors = []
+            
+            # One header probe for every sheet about to be written
+            try:
+                self.sheets_handler.prefetch_headers(
+                    [sheet_name for sheet_name, rows in batches if rows]
+                )
+            except Exception as e:
+                logger.warning("Failed to prefetch sheet headers: %s", e)
+            
+            for sheet_name, rows in batches:
+                if not rows:
+                    continue
+                try:
+                    self.sheets_handler.append_to_sheet(
+                        sheet_name, [self._to_sheet_row(row) for row in rows]
+                    )
+                except Exception as e:
+                    logger.error("Failed to write %d rows to %s: %s", len(rows), sheet_name, e)
+    
+    def reset_watermark(self):
+        """Forget the saved input row watermark so the next run reads every row"""
+        with self._sheets_lock:
+            self._db.execute("DELETE FROM watermark WHERE sheet = ?", (self._input_sheet,))
+    
+    def _dedupe_pending(self, pending_videos: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Drop duplicate requests and videos that were already completed
+        
+        Skipped rows get a final status in the input sheet so later runs
+        don't read them again: 'completed' for a request already done under
+        the same ID, 'duplicate' for a repeat of a request earlier in the run.
+        
+        Args:
+            pending_videos: Video requests read from the input sheet
+            
+        Yields:
+            Requests that still need processing
+        """
+        with self._sheets_lock:
+            # A reused ID with a different request is new work. Rows from
+            # before request keys were recorded match on ID and topic.
+            completed = {
+                (video_id, request_key or topic)
+                for video_id, topic, request_key in self._db.execute(
+                    "SELECT id, topic, request_key FROM done"
+                )
             }
-            self.sheets_handler.append_to_sheet('Error Log', [error_data])
-        except Exception as e:
-            logger.error(f"Failed to log error to sheets: {str(e)}")
+        
+        seen = set()
+        for video_data in pending_videos:
+            topic = video_data.get('topic', '')
+            key = _request_key(topic, video_data.get('prompts', ''))
+            video_id = video_data.get('id')
+            
+            if (video_id, key) in completed or (video_id, topic) in completed:
+                status = 'completed'
+                logger.info("Skipping already completed video: %s", video_id)
+            elif key in seen:
+                status = 'duplicate'
+                logger.info("Skipping duplicate video request: %s", topic)
+            else:
+                seen.add(key)
+                yield video_data
+                continue
+            
+            row_number = video_data.get('row_number')
+            if row_number:
+                with self._sheets_lock:
+                    self.sheets_handler.update_row_status(self._input_sheet, row_number, status)
     
-    def mark_as_done(self, result: Dict):
-        """Mark video as completed in Google Sheets"""
-        try:
-            self.sheets_handler.append_to_sheet(
-                self.config['google_sheets']['output_sheet'],
-                [result]
-            )
-            logger.info(f"Marked video as done: {result['id']}")
-        except Exception as e:
-            logger.error(f"Failed to mark as done: {str(e)}")
+    def _prefetch_scripts(self, pending_videos: Iterable[Dict],
+                          executor: ThreadPoolExecutor) -> Iterator[Dict]:
+        """
+        Generate scripts for groups of pending videos with one AI request each
+        
+        Each group's request is submitted to the executor ahead of its
+        videos, so reading and submitting carry on while it runs. The
+        videos wait for it through their 'scripts_ready' future.
+        
+        Args:
+            pending_videos: Video requests to process
+            executor: Pool the videos will be processed on
+            
+        Yields:
+            The same requests, with 'scripts_ready' set
+        """
+        batch_size = self.video_generator.script_batch_size
+        if batch_size < 2:
+            yield from pending_videos
+            return
+        
+        pending_videos = iter(pending_videos)
+        while True:
+            batch = list(islice(pending_videos, batch_size))
+            if not batch:
+                return
+            
+            scripts_ready = executor.submit(self.video_generator.prefetch_scripts, [
+                (video_data.get('topic', ''), video_data.get('prompts', ''))
+                for video_data in batch
+            ])
+            for video_data in batch:
+                video_data['scripts_ready'] = scripts_ready
+                yield video_data
     
     def run_once(self):
         """Process all pending video requests once"""
         logger.info("Starting video generation run")
         
-        # Get pending videos from Google Sheets
-        pending_videos = self.sheets_handler.get_pending_videos(
-            self.config['google_sheets']['input_sheet']
-        )
+        # Renders from earlier runs have finished, so their assets may be evicted
+        with self._cache_lock:
+            self._cache_in_use.clear()
         
-        logger.info(f"Found {len(pending_videos)} pending videos")
+        # Stream pending videos from Google Sheets page by page
+        with self._sheets_lock:
+            watermark = self._db.execute(
+                "SELECT next_row, last_id FROM watermark WHERE sheet = ?", (self._input_sheet,)
+            ).fetchone()
+        start_row, last_id = watermark or (2, None)
         
-        for video_data in pending_videos:
+        # Videos are independent and I/O bound, so process them in parallel.
+        # Each one is submitted as soon as its page is read.
+        futures = {}
+        read_error = None
+        with ThreadPoolExecutor(max_workers=max(1, self._workers)) as executor:
+            # Skip the rows already known to be completed
+            pending_videos = self._prefetch_scripts(self._dedupe_pending(
+                self.sheets_handler.iter_pending_videos(
+                    self._input_sheet, start_row=start_row, last_completed_id=last_id
+                )
+            ), executor)
+            
             try:
-                result = self.process_video_request(video_data)
-                self.mark_as_done(result)
+                for video_data in pending_videos:
+                    futures[executor.submit(self.process_video_request, video_data)] = video_data
             except Exception as e:
-                logger.error(f"Unexpected error processing video: {str(e)}", exc_info=True)
+                # Videos already submitted still run to completion (and get
+                # uploaded), so record their results before giving up
+                logger.error("Failed to read pending videos: %s", e)
+                read_error = e
+            logger.info("Found %d pending videos", len(futures))
+            
+            for future in as_completed(futures):
+                video_data = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # One failed video must not stop the others; record it
+                    # like any other failure so it reaches the sheets
+                    logger.error("Unexpected error processing video: %s", e,
+                                 exc_info=logger.isEnabledFor(logging.DEBUG))
+                    result = VideoResult(
+                        id=video_data.get('id', ''),
+                        topic=video_data.get('topic', ''),
+                        status='failed',
+                        error=str(e)
+                    )
+                    self.log_error(result)
+                
+                try:
+                    self.mark_as_done(result, _request_key(
+                        video_data.get('topic', ''), video_data.get('prompts', '')
+                    ))
+                    
+                    # Mark the input row so later runs skip it
+                    row_number = video_data.get('row_number')
+                    if result.status == 'completed' and row_number:
+                        with self._sheets_lock:
+                            self.sheets_handler.update_row_status(
+                                self._input_sheet, row_number, 'completed'
+                            )
+                except Exception as e:
+                    logger.error("Failed to record video result: %s", e,
+                                 exc_info=logger.isEnabledFor(logging.DEBUG))
+        
+        next_row = self.sheets_handler.first_open_row.get(self._input_sheet)
+        if next_row:
+            with self._sheets_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO watermark (sheet, next_row, last_id) VALUES (?, ?, ?)",
+                    (self._input_sheet, next_row,
+                     self.sheets_handler.last_completed_id.get(self._input_sheet))
+                )
+        
+        self.flush_sheets()
+        
+        if read_error is not None:
+            raise read_error
+    
+    def _get_sheet_modified_time(self) -> Optional[str]:
+        """Get the spreadsheet's last modified time, or None if it can't be read"""
+        try:
+            with self._sheets_lock:
+                return self.sheets_handler.get_modified_time()
+        except Exception as e:
+            logger.warning("Failed to check spreadsheet modified time: %s", e)
+            return None
+    
+    def _run_if_changed(self, last_modified: Optional[str]) -> Optional[str]:
+        """
+        Run once if the spreadsheet changed since the last run
+        
+        Args:
+            last_modified: Spreadsheet modified time recorded before the last run
+            
+        Returns:
+            Modified time to compare against on the next check
+        """
+        # Cheap metadata probe; skip the full sheet read when nothing changed
+        modified = self._get_sheet_modified_time()
+        
+        if modified is not None and modified == last_modified:
+            logger.info("Spreadsheet unchanged since last run, skipping")
+            return last_modified
+        
+        try:
+            self.run_once()
+        except Exception as e:
+            logger.error("Error in continuous run: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+            return last_modified
+        
+        # Keep the time read before the run: an edit made while it was in
+        # progress must still trigger the next check. Our own status writes
+        # cost one extra run, which the watermark and dedupe keep cheap.
+        return modified
+    
+    async def run_continuous_async(self, check_interval: int = 60):
+        """
+        Run continuously on the event loop, checking for new videos at regular intervals
+        
+        Blocking Sheets, generation and upload work runs in an executor so
+        other tasks can share the loop.
+        
+        Args:
+            check_interval: Minimum seconds between the start of consecutive checks
+        """
+        logger.info("Starting continuous video generation (checking every %ss)", check_interval)
+        
+        loop = asyncio.get_running_loop()
+        last_modified = None
+        
+        while True:
+            # The interval counts from the start of the check, not its end
+            last_modified, _ = await asyncio.gather(
+                loop.run_in_executor(None, self._run_if_changed, last_modified),
+                asyncio.sleep(check_interval)
+            )
     
     def run_continuous(self, check_interval: int = 60):
         """
@@ -236,16 +812,7 @@ class AutoVideoGenerator:
         Args:
             check_interval: Seconds between checks for new videos
         """
-        logger.info(f"Starting continuous video generation (checking every {check_interval}s)")
-        
-        while True:
-            try:
-                self.run_once()
-            except Exception as e:
-                logger.error(f"Error in continuous run: {str(e)}", exc_info=True)
-            
-            logger.info(f"Waiting {check_interval} seconds before next check")
-            time.sleep(check_interval)
+        asyncio.run(self.run_continuous_async(check_interval))
 
 
 def main():
@@ -258,13 +825,19 @@ def main():
                       help='Run once or continuously')
     parser.add_argument('--interval', type=int, default=60,
                       help='Check interval in seconds (for continuous mode)')
+    parser.add_argument('--rescan', action='store_true',
+                      help='Read the whole input sheet, ignoring the saved row watermark')
     
     args = parser.parse_args()
+    _configure_logging()
     
     # Initialize the generator
     generator = AutoVideoGenerator(args.config)
     generator.initialize_handlers()
     
+    if args.rescan:
+        generator.reset_watermark()
+    
     # Run based on mode
     if args.mode == 'once':
         generator.run_once()
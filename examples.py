@@ -7,14 +7,14 @@ Demonstrates how to use the Automated Video Generator programmatically
 import os
 import sys
 from pathlib import Path
-from auto_video_generator import AutoVideoGenerator
-from sheets_handler import GoogleSheetsHandler, setup_sample_sheet
 
 
 def example_1_basic_usage():
     """
     Example 1: Basic usage - process all pending videos once
     """
+    from auto_video_generator import AutoVideoGenerator
+    
     print("\n=== Example 1: Basic Usage ===\n")
     
     # Initialize the generator
@@ -31,6 +31,8 @@ def example_2_single_video():
     """
     Example 2: Process a single video request directly
     """
+    from auto_video_generator import AutoVideoGenerator
+    
     print("\n=== Example 2: Single Video Processing ===\n")
     
     # Initialize
@@ -47,19 +49,22 @@ def example_2_single_video():
     
     # Process the video
     result = generator.process_video_request(video_request)
+    generator.flush_sheets()
     
-    if result['status'] == 'completed':
+    if result.status == 'completed':
         print(f"\n✓ Video created successfully!")
-        print(f"  YouTube URL: {result['youtube_url']}")
-        print(f"  Video File: {result['video_file']}")
+        print(f"  YouTube URL: {result.youtube_url}")
+        print(f"  Video File: {result.video_file}")
     else:
-        print(f"\n✗ Video processing failed: {result.get('error')}")
+        print(f"\n✗ Video processing failed: {result.error}")
 
 
 def example_3_batch_processing():
     """
     Example 3: Batch process multiple videos
     """
+    from auto_video_generator import AutoVideoGenerator
+    
     print("\n=== Example 3: Batch Processing ===\n")
     
     generator = AutoVideoGenerator('config.json')
@@ -90,12 +95,15 @@ def example_3_batch_processing():
         try:
             result = generator.process_video_request(video)
             results.append(result)
-            print(f"  Status: {result['status']}")
+            print(f"  Status: {result.status}")
         except Exception as e:
             print(f"  Error: {str(e)}")
     
+    # Write any queued errors to Google Sheets
+    generator.flush_sheets()
+    
     # Summary
-    completed = sum(1 for r in results if r['status'] == 'completed')
+    completed = sum(1 for r in results if r.status == 'completed')
     print(f"\n✓ Batch complete: {completed}/{len(videos)} videos successful")
 
 
@@ -103,6 +111,8 @@ def example_4_custom_config():
     """
     Example 4: Use custom configuration
     """
+    from auto_video_generator import AutoVideoGenerator
+    
     print("\n=== Example 4: Custom Configuration ===\n")
     
     # Create custom config
@@ -131,9 +141,14 @@ def example_4_custom_config():
     }
     
     # Save custom config
-    import json
-    with open('custom_config.json', 'w') as f:
-        json.dump(custom_config, f, indent=2)
+    try:
+        import orjson
+        with open('custom_config.json', 'wb') as f:
+            f.write(orjson.dumps(custom_config, option=orjson.OPT_INDENT_2))
+    except ImportError:
+        import json
+        with open('custom_config.json', 'w') as f:
+            json.dump(custom_config, f, indent=2)
     
     # Use custom config
     generator = AutoVideoGenerator('custom_config.json')
@@ -144,6 +159,8 @@ def example_5_monitoring():
     """
     Example 5: Monitor video processing with callbacks
     """
+    from auto_video_generator import AutoVideoGenerator
+    
     print("\n=== Example 5: Monitoring with Callbacks ===\n")
     
     class MonitoredGenerator(AutoVideoGenerator):
@@ -153,8 +170,8 @@ def example_5_monitoring():
             print(f"🎬 Starting: {video_data['topic']}")
         
         def on_video_complete(self, result):
-            print(f"✓ Completed: {result['topic']}")
-            print(f"  URL: {result['youtube_url']}")
+            print(f"✓ Completed: {result.topic}")
+            print(f"  URL: {result.youtube_url}")
         
         def on_video_error(self, video_data, error):
             print(f"✗ Error: {video_data['topic']}")
@@ -164,10 +181,10 @@ def example_5_monitoring():
             self.on_video_start(row_data)
             try:
                 result = super().process_video_request(row_data)
-                if result['status'] == 'completed':
+                if result.status == 'completed':
                     self.on_video_complete(result)
                 else:
-                    self.on_video_error(row_data, result.get('error'))
+                    self.on_video_error(row_data, result.error)
                 return result
             except Exception as e:
                 self.on_video_error(row_data, e)
@@ -183,6 +200,8 @@ def example_6_sheets_setup():
     """
     Example 6: Set up Google Sheets with sample data
     """
+    from sheets_handler import GoogleSheetsHandler, setup_sample_sheet
+    
     print("\n=== Example 6: Google Sheets Setup ===\n")
     
     # Initialize sheets handler
@@ -206,6 +225,8 @@ def example_7_continuous_mode():
     """
     Example 7: Run in continuous mode
     """
+    from auto_video_generator import AutoVideoGenerator
+    
     print("\n=== Example 7: Continuous Mode ===\n")
     print("This will run continuously, checking for new videos every 60 seconds")
     print("Press Ctrl+C to stop\n")
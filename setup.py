@@ -7,8 +7,12 @@ Helps configure API keys, credentials, and test the system
 import os
 import sys
 import json
+import shutil
 from pathlib import Path
 
+# Resolved FFmpeg executable, cached after the first lookup
+_FFMPEG_PATH = None
+
 
 def print_header(text):
     """Print formatted header"""
@@ -165,21 +169,25 @@ def check_dependencies():
     return True
 
 
-def check_ffmpeg():
+def check_ffmpeg(verbose=False):
     """Check if FFmpeg is installed"""
+    global _FFMPEG_PATH
+    
     print_header("Checking FFmpeg")
     
-    import subprocess
+    if _FFMPEG_PATH is None:
+        _FFMPEG_PATH = shutil.which('ffmpeg')
     
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            version = result.stdout.split('\n')[0]
-            print(f"✓ FFmpeg installed: {version}")
-            return True
-    except FileNotFoundError:
-        pass
+    if _FFMPEG_PATH:
+        if verbose:
+            import subprocess
+            
+            result = subprocess.run([_FFMPEG_PATH, '-version'],
+                                  capture_output=True, text=True)
+            print(f"✓ FFmpeg installed: {result.stdout.splitlines()[0]}")
+        else:
+            print(f"✓ FFmpeg installed: {_FFMPEG_PATH}")
+        return True
     
     print("✗ FFmpeg not found")
     print("\nFFmpeg is required for video processing.")
@@ -4,7 +4,8 @@ Manages reading video requests and writing results to Google Sheets
 """
 
 import logging
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Optional, Set
 from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from googleapiclient.discovery import build
@@ -12,6 +13,12 @@ from googleapiclient.errors import HttpError
 
 logger = logging.getLogger(__name__)
 
+# Padding for short rows in the input sheet (ID, Topic, Prompts, Status)
+_EMPTY_ROW = ['', '', '', '']
+
+# Input row statuses that need no further processing
+_DONE_STATUSES = frozenset({'completed', 'duplicate'})
+
 
 class GoogleSheetsHandler:
     """Handle Google Sheets operations for video automation"""
@@ -26,11 +33,34 @@ class GoogleSheetsHandler:
         """
         self.spreadsheet_id = spreadsheet_id
         self.credentials = self._load_credentials(credentials_path)
-        self.service = build('sheets', 'v4', credentials=self.credentials)
+        # Bundled discovery document; no discovery request on startup
+        self.service = build('sheets', 'v4', credentials=self.credentials,
+                             static_discovery=True)
+        self.drive_service = None
+        # Status cell updates queued by update_row_status
+        self._pending_status_updates: List[Dict] = []
+        # Spreadsheet metadata reused across calls; see invalidate_cache
+        self._sheet_names_cache: Optional[Set[str]] = None
+        self._headers_cache: Dict[str, List[str]] = {}
+        # Per sheet, the first row not known to be completed, as seen by the
+        # last iter_pending_videos scan, and the ID in the row just above it;
+        # callers persist both as a watermark
+        self.first_open_row: Dict[str, int] = {}
+        self.last_completed_id: Dict[str, Optional[str]] = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush_status_updates()
         
     def _load_credentials(self, credentials_path: str):
         """Load Google service account credentials"""
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+        SCOPES = [
+            'https://www.googleapis.com/auth/spreadsheets',
+            # Needed to read the spreadsheet's modified time
+            'https://www.googleapis.com/auth/drive.metadata.readonly'
+        ]
         
         try:
             credentials = ServiceAccountCredentials.from_service_account_file(
@@ -42,6 +72,29 @@ class GoogleSheetsHandler:
             logger.error(f"Failed to load credentials: {str(e)}")
             raise
     
+    def get_modified_time(self) -> str:
+        """
+        Get the last modified time of the spreadsheet
+        
+        Returns:
+            RFC 3339 timestamp of the last change to any sheet
+        """
+        try:
+            if self.drive_service is None:
+                self.drive_service = build('drive', 'v3', credentials=self.credentials,
+                                           static_discovery=True)
+            
+            result = self.drive_service.files().get(
+                fileId=self.spreadsheet_id,
+                fields='modifiedTime'
+            ).execute()
+            
+            return result['modifiedTime']
+            
+        except Exception as e:
+            logger.error(f"Error getting spreadsheet modified time: {str(e)}")
+            raise
+    
     def get_pending_videos(self, sheet_name: str) -> List[Dict]:
         """
         Get all pending video requests from the input sheet
@@ -52,70 +105,166 @@ class GoogleSheetsHandler:
         Returns:
             List of dictionaries containing video request data
         """
-        try:
-            # Read the sheet
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{sheet_name}!A:E"  # Adjust range as needed
-            ).execute()
+        pending_videos = list(self.iter_pending_videos(sheet_name))
+        logger.info(f"Found {len(pending_videos)} pending videos")
+        return pending_videos
+    
+    def iter_pending_videos(self, sheet_name: str, page_size: int = 500,
+                            start_row: int = 2,
+                            last_completed_id: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Stream pending video requests from the input sheet, one page of rows at a time
+        
+        Rows above start_row are not read at all. While scanning, the end of
+        the leading run of completed rows is recorded in first_open_row, and
+        the ID of the row above it in last_completed_id, so the next scan can
+        start there.
+        
+        A saved start_row is only trusted if the row above it still holds
+        last_completed_id. If rows were deleted or moved, the scan starts
+        over from row 2.
+        
+        Args:
+            sheet_name: Name of the sheet to read from
+            page_size: Number of rows fetched per request
+            start_row: First row to read; earlier rows must all be completed
+            last_completed_id: ID expected in row start_row - 1
+            
+        Yields:
+            Dictionaries containing video request data
+        """
+        # Row 1 holds headers
+        start = max(start_row, 2)
+        
+        # Read the row above start_row with the first page to check it
+        check_row = start - 1 if start > 2 else None
+        if check_row is not None and last_completed_id is None:
+            logger.warning(f"Saved position in {sheet_name} can't be verified, reading from row 2")
+            start = 2
+            check_row = None
+        if check_row is not None:
+            start = check_row
+        
+        self.first_open_row[sheet_name] = start if check_row is None else start + 1
+        self.last_completed_id[sheet_name] = None if check_row is None else last_completed_id
+        
+        # A page comes back short whenever it ends in blank rows, even if more
+        # requests follow further down. The first request therefore also
+        # reads the whole topic column from start, whose length gives the
+        # last row worth reading; later pages stop there.
+        last_row = None
+        
+        while last_row is None or start <= last_row:
+            end = start + page_size - 1
+            ranges = [f"{sheet_name}!A{start}:E{end}"]
+            if last_row is None:
+                ranges.append(f"{sheet_name}!B{start}:B")
             
-            values = result.get('values', [])
+            try:
+                result = self.service.spreadsheets().values().batchGet(
+                    spreadsheetId=self.spreadsheet_id,
+                    ranges=ranges,
+                    majorDimension='ROWS'
+                ).execute()
+            except HttpError as e:
+                if check_row is not None and e.resp.status == 400:
+                    # The saved position is past the end of the grid, so
+                    # rows were deleted since it was stored
+                    logger.warning(
+                        f"Saved position in {sheet_name} is past the end of the sheet, reading from row 2"
+                    )
+                    start, check_row, last_row = 2, None, None
+                    self.first_open_row[sheet_name] = start
+                    self.last_completed_id[sheet_name] = None
+                    continue
+                logger.error(f"Google Sheets API error: {str(e)}")
+                raise
+            except Exception as e:
+                logger.error(f"Error reading sheet: {str(e)}")
+                raise
             
-            if not values:
-                logger.info("No data found in sheet")
-                return []
+            value_ranges = result.get('valueRanges', [])
+            values = value_ranges[0].get('values', []) if value_ranges else []
+            if last_row is None:
+                topics = value_ranges[1].get('values', []) if len(value_ranges) > 1 else []
+                last_row = start + len(topics) - 1
+            first = start
             
-            # Assume first row is headers
-            headers = values[0]
-            pending_videos = []
+            if check_row is not None:
+                anchor_id = (values[0] + _EMPTY_ROW)[0] if values else ''
+                check_row = None
+                if anchor_id != last_completed_id:
+                    logger.warning(
+                        f"Rows above the saved position in {sheet_name} changed, reading from row 2"
+                    )
+                    start, last_row = 2, None
+                    self.first_open_row[sheet_name] = start
+                    self.last_completed_id[sheet_name] = None
+                    continue
+                values = values[1:]
+                first += 1
             
-            for i, row in enumerate(values[1:], start=2):
-                # Skip if row is marked as processed
-                if len(row) > 3 and row[3].lower() == 'completed':
+            for i, row in enumerate(values, start=first):
+                # The API drops trailing empty cells, so pad once and unpack
+                # instead of bounds-checking every column
+                video_id, topic, prompts, status = (row + _EMPTY_ROW)[:4]
+                
+                if status.lower() in _DONE_STATUSES:
+                    if self.first_open_row[sheet_name] == i:
+                        self.first_open_row[sheet_name] = i + 1
+                        self.last_completed_id[sheet_name] = video_id
+                    continue
+                
+                # Only include rows with topics
+                if not topic:
                     continue
                 
-                # Parse row data
-                video_data = {
-                    'id': row[0] if len(row) > 0 else f"video_{i}",
-                    'topic': row[1] if len(row) > 1 else '',
-                    'prompts': row[2] if len(row) > 2 else '',
-                    'status': row[3] if len(row) > 3 else 'pending',
+                yield {
+                    'id': video_id,
+                    'topic': topic,
+                    'prompts': prompts,
+                    'status': status or 'pending',
                     'row_number': i
                 }
-                
-                if video_data['topic']:  # Only include rows with topics
-                    pending_videos.append(video_data)
-            
-            logger.info(f"Found {len(pending_videos)} pending videos")
-            return pending_videos
             
-        except HttpError as e:
-            logger.error(f"Google Sheets API error: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Error reading sheet: {str(e)}")
-            raise
+            start = end + 1
+    
+    def invalidate_cache(self):
+        """Forget cached sheet names and headers after external changes to the spreadsheet"""
+        self._sheet_names_cache = None
+        self._headers_cache = {}
     
     def update_row_status(self, sheet_name: str, row_number: int, status: str):
         """
-        Update the status of a specific row
+        Queue a status update for a specific row
+        
+        Updates are written together by flush_status_updates.
         
         Args:
             sheet_name: Name of the sheet
             row_number: Row number to update (1-indexed)
             status: New status value
         """
+        self._pending_status_updates.append({
+            'range': f"{sheet_name}!D{row_number}",  # Column D is status
+            'values': [[status]]
+        })
+    
+    def flush_status_updates(self):
+        """Write all queued status updates in a single batchUpdate request"""
+        if not self._pending_status_updates:
+            return
+        
+        updates = self._pending_status_updates
+        self._pending_status_updates = []
+        
         try:
-            range_name = f"{sheet_name}!D{row_number}"  # Column D is status
-            
-            self.service.spreadsheets().values().update(
+            self.service.spreadsheets().values().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body={'values': [[status]]}
+                body={'valueInputOption': 'RAW', 'data': updates}
             ).execute()
             
-            logger.info(f"Updated row {row_number} status to: {status}")
+            logger.info(f"Updated status of {len(updates)} rows")
             
         except Exception as e:
             logger.error(f"Error updating row status: {str(e)}")
@@ -123,7 +272,10 @@ class GoogleSheetsHandler:
     
     def append_to_sheet(self, sheet_name: str, rows: List[Dict]):
         """
-        Append rows to a sheet
+        Append rows to a sheet in a single request
+        
+        Pass all rows at once rather than calling this in a per-row loop;
+        use append_rows_bulk for large or streamed inputs.
         
         Args:
             sheet_name: Name of the sheet to append to
@@ -134,27 +286,26 @@ class GoogleSheetsHandler:
             if not rows:
                 return
             
-            # Get headers from first row
-            headers = list(rows[0].keys())
+            # Get headers from all rows, in order of first appearance
+            headers = list(dict.fromkeys(key for row in rows for key in row))
             values = [[row.get(h, '') for h in headers] for row in rows]
             
             # Check if sheet has headers, if not add them
-            try:
-                existing = self.service.spreadsheets().values().get(
-                    spreadsheetId=self.spreadsheet_id,
-                    range=f"{sheet_name}!A1:Z1"
-                ).execute()
-                
-                if not existing.get('values'):
-                    # Add headers
-                    self.service.spreadsheets().values().update(
-                        spreadsheetId=self.spreadsheet_id,
-                        range=f"{sheet_name}!A1",
-                        valueInputOption='RAW',
-                        body={'values': [headers]}
-                    ).execute()
-            except:
-                pass
+            if sheet_name not in self._headers_cache:
+                try:
+                    self.prefetch_headers([sheet_name])
+                    
+                    if sheet_name not in self._headers_cache:
+                        # Add headers
+                        self.service.spreadsheets().values().update(
+                            spreadsheetId=self.spreadsheet_id,
+                            range=f"{sheet_name}!A1",
+                            valueInputOption='RAW',
+                            body={'values': [headers]}
+                        ).execute()
+                        self._headers_cache[sheet_name] = headers
+                except:
+                    pass
             
             # Append the data
             self.service.spreadsheets().values().append(
@@ -171,6 +322,28 @@ class GoogleSheetsHandler:
             logger.error(f"Error appending to sheet: {str(e)}")
             raise
     
+    def prefetch_headers(self, sheet_names: List[str]):
+        """
+        Fetch the header rows of several sheets in one batchGet request
+        
+        Args:
+            sheet_names: Names of the sheets whose headers should be cached
+        """
+        missing = [name for name in sheet_names if name not in self._headers_cache]
+        if not missing:
+            return
+        
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=[f"{name}!A1:Z1" for name in missing],
+            majorDimension='ROWS'
+        ).execute()
+        
+        # Sheets without a header row are left uncached
+        for name, value_range in zip(missing, result.get('valueRanges', [])):
+            if value_range.get('values'):
+                self._headers_cache[name] = value_range['values'][0]
+    
     def create_sheet_if_not_exists(self, sheet_name: str):
         """
         Create a new sheet if it doesn't exist
@@ -179,16 +352,18 @@ class GoogleSheetsHandler:
             sheet_name: Name of the sheet to create
         """
         try:
-            # Get spreadsheet metadata
-            spreadsheet = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
+            # Get spreadsheet metadata once, fetching only the sheet titles
+            if self._sheet_names_cache is None:
+                spreadsheet = self.service.spreadsheets().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    fields='sheets.properties.title'
+                ).execute()
+                
+                sheets = spreadsheet.get('sheets', [])
+                self._sheet_names_cache = {s['properties']['title'] for s in sheets}
             
             # Check if sheet exists
-            sheets = spreadsheet.get('sheets', [])
-            sheet_names = [s['properties']['title'] for s in sheets]
-            
-            if sheet_name not in sheet_names:
+            if sheet_name not in self._sheet_names_cache:
                 # Create the sheet
                 request = {
                     'addSheet': {
@@ -203,6 +378,7 @@ class GoogleSheetsHandler:
                     body={'requests': [request]}
                 ).execute()
                 
+                self._sheet_names_cache.add(sheet_name)
                 logger.info(f"Created new sheet: {sheet_name}")
             
         except Exception as e:
@@ -210,6 +386,32 @@ class GoogleSheetsHandler:
             raise
 
 
+def append_rows_bulk(handler: GoogleSheetsHandler, sheet_name: str,
+                     rows: Iterable[Dict], chunk_size: int = 2000) -> int:
+    """
+    Append rows to a sheet with one request per chunk
+    
+    Args:
+        handler: GoogleSheetsHandler instance
+        sheet_name: Name of the sheet to append to
+        rows: Dictionaries to append, consumed lazily
+        chunk_size: Maximum number of rows sent per request
+        
+    Returns:
+        Number of rows appended
+    """
+    total = 0
+    rows = iter(rows)
+    
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return total
+        
+        handler.append_to_sheet(sheet_name, chunk)
+        total += len(chunk)
+
+
 def setup_sample_sheet(handler: GoogleSheetsHandler):
     """
     Set up a sample input sheet with example data
@@ -236,5 +438,5 @@ def setup_sample_sheet(handler: GoogleSheetsHandler):
         }
     ]
     
-    handler.append_to_sheet("Video Ideas", sample_data)
+    append_rows_bulk(handler, "Video Ideas", sample_data)
     logger.info("Sample sheet created with example videos")
@@ -4,18 +4,124 @@ Handles video creation using AI services
 """
 
 import os
+import re
+import asyncio
+import hashlib
 import logging
 import json
 import requests
+import shutil
 import subprocess
+import tempfile
+import threading
+import uuid
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 import anthropic
+import httpx
 import openai
 
+try:
+    import orjson  # Optional, faster JSON parsing
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Outermost JSON object or array in a model response, ignoring any prose or
+# markdown code fences around it
+_JSON_PAYLOAD = re.compile(r'[\[{].*[\]}]', re.S)
+
+# Bump to invalidate cached scripts and audio after a model or output change
+CACHE_VERSION = 1
+
+# Response tokens budgeted per script, and the most one response can hold
+# for each provider's model. gpt-4 shares its 8K context between prompt and
+# response, which leaves room for about three scripts.
+SCRIPT_MAX_TOKENS = 2000
+RESPONSE_TOKEN_LIMITS = {'openai': 6000, 'anthropic': 16000}
+
+# Prompt caching needs a prefix of at least 1024 tokens; at roughly four
+# characters per token, shorter system prompts are not worth marking
+MIN_CACHEABLE_PROMPT_CHARS = 4 * 1024
+
+# Appended to the system prompt when several scripts are requested at once
+BATCH_SCRIPT_INSTRUCTIONS = """
+
+        You will receive {count} numbered requests. Return a JSON array with exactly
+        {count} objects in the structure above, one per request, in request order."""
+
+# Overlay text is read from a file (textfile=) rather than spliced into the
+# filtergraph, so quotes, colons and %{...} in titles cannot break parsing
+INTRO_TEXT_FILTER = "drawtext=textfile={}:expansion=none:fontsize=72:fontcolor=white:x=(w-text_w)/2:y=(h-text_h)/2"
+SCENE_TEXT_FILTER = "drawtext=textfile={}:expansion=none:fontsize=48:fontcolor=white:x=(w-text_w)/2:y=(h-text_h)/2"
+
+# Placeholder clips are a flat colour plus static text; the fastest preset
+# produces the same picture for a fraction of the CPU time of the default.
+# Intro and scenes share these so their streams can be concatenated by copy.
+PLACEHOLDER_VIDEO_ARGS = (
+    '-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'stillimage',
+    '-pix_fmt', 'yuv420p'
+)
+
+# Solid colour lavfi input; only the colour and duration vary per clip
+COLOR_SOURCE = "color=c={color}:s=1920x1080:d={duration}"
+
+# Prepended to every FFmpeg command line
+_FFMPEG_QUIET_ARGS = ('-hide_banner', '-loglevel', 'error', '-nostats')
+
+# Characters with special meaning inside a filter option value
+_FILTER_ESCAPES = str.maketrans({'\\': '\\\\', "'": "\\'", ':': '\\:'})
+
+DEFAULT_SYSTEM_PROMPT = """You are an expert video script writer. Create engaging, 
+        concise scripts for YouTube videos. Include visual descriptions, narration, 
+        and pacing suggestions. Return your response in JSON format with the following structure:
+        {
+            "title": "video title",
+            "script": "full narration script",
+            "scenes": [{"narration": "text", "visuals": "description", "duration": seconds}],
+            "mood": "upbeat/calm/dramatic/etc",
+            "visual_style": "modern/cinematic/minimalist/etc",
+            "estimated_duration": seconds
+        }"""
+
+
+def _loads(text: str):
+    """Parse JSON with orjson when it is installed"""
+    return orjson.loads(text) if orjson else json.loads(text)
+
+
+def store_cached_file(src, dst: Path):
+    """
+    Hard link a generated file into the cache, copying across filesystems
+    
+    The file is staged under a name unique to this process and thread and
+    then renamed over dst, so concurrent writers of the same key never
+    share a temp file and readers never see a partial copy.
+    
+    Args:
+        src: Path of the generated file
+        dst: Cache path to store it at
+        
+    Raises:
+        OSError: If the file can't be linked or copied
+    """
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        # Left behind by a crashed writer whose process and thread IDs were reused
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(src, tmp)
+        except OSError:
+            # copyfile uses os.sendfile on Linux, so the data stays in the kernel
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        # rename() is a no-op when dst is already a link to the same file,
+        # which leaves tmp in place
+        tmp.unlink(missing_ok=True)
+
 
 class VideoGenerator:
     """Generate videos using AI services and video editing tools"""
@@ -31,23 +137,151 @@ class VideoGenerator:
         self.output_dir = Path("output_videos")
         self.output_dir.mkdir(exist_ok=True)
         
+        # Scripts and audio are pure functions of their inputs, so results
+        # are kept on disk and reused across retries and reruns
+        self.cache_enabled = config.get('cache_results', True)
+        self.cache_dir = self.output_dir / ".cache"
+        if self.cache_enabled:
+            self.cache_dir.mkdir(exist_ok=True)
+        
         # Initialize AI clients based on config
         self.ai_provider = config.get('ai_provider', 'openai')
         self._init_ai_client()
         
+        # Number of scripts per AI request, capped so a batch response fits
+        # the model's output limit, and scenes per FFmpeg process
+        self.script_batch_size = min(
+            config.get('script_batch_size', 10),
+            RESPONSE_TOKEN_LIMITS.get(self.ai_provider, SCRIPT_MAX_TOKENS) // SCRIPT_MAX_TOKENS
+        )
+        self.scene_batch_size = config.get('scene_batch_size', 4)
+        
+        # Shared by every worker thread's event loop, so the number of
+        # FFmpeg processes stays at the core count however many videos are
+        # in flight
+        self._ffmpeg_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+        
     def _init_ai_client(self):
         """Initialize AI client based on provider"""
+        # One pooled HTTP client for the lifetime of the generator, so script
+        # and TTS calls reuse warm keep-alive connections instead of paying
+        # for a new TLS handshake each time
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+        
         if self.ai_provider == 'openai':
-            self.ai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+            self.ai_client = openai.OpenAI(
+                api_key=os.getenv('OPENAI_API_KEY'),
+                http_client=self.http_client
+            )
         elif self.ai_provider == 'anthropic':
-            self.ai_client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+            self.ai_client = anthropic.Anthropic(
+                api_key=os.getenv('ANTHROPIC_API_KEY'),
+                http_client=self.http_client
+            )
         else:
             logger.warning(f"Unknown AI provider: {self.ai_provider}")
     
+    def _cache_path(self, kind: str, suffix: str, *parts) -> Path:
+        """
+        Get the cache location for a generated result
+        
+        Args:
+            kind: Type of result, e.g. 'script' or 'voiceover'
+            suffix: File extension of the cached file
+            *parts: Inputs the result depends on
+            
+        Returns:
+            Path derived from a hash of the inputs
+        """
+        payload = json.dumps([CACHE_VERSION, self.ai_provider, kind, *parts])
+        key = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.{kind}{suffix}"
+    
+    def _output_path(self, prefix: str, suffix: str) -> Path:
+        """
+        Build a unique path in the output directory
+        
+        Args:
+            prefix: Start of the file name
+            suffix: File extension
+            
+        Returns:
+            Timestamped path with a random tag, so videos rendered in
+            parallel within the same second never share a file
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return self.output_dir / f"{prefix}_{timestamp}_{uuid.uuid4().hex[:8]}{suffix}"
+    
+    def _write_overlay_text(self, text: str) -> Path:
+        """
+        Write overlay text to a temporary file for drawtext
+        
+        Args:
+            text: Text to display
+            
+        Returns:
+            Path to the text file; the caller removes it after rendering
+        """
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt',
+                                         dir=self.output_dir, delete=False) as f:
+            f.write(text)
+        return Path(f.name)
+    
+    async def _run_ffmpeg(self, args: List[str]):
+        """
+        Run an FFmpeg command without blocking the event loop
+        
+        Args:
+            args: Command line, starting with the executable
+            
+        Raises:
+            subprocess.CalledProcessError: If FFmpeg exits with an error
+        """
+        # Wait for a process slot without blocking the event loop. If this
+        # task is cancelled while waiting, the slot is released as soon as
+        # the pending acquire completes.
+        acquire = asyncio.get_running_loop().run_in_executor(None, self._ffmpeg_slots.acquire)
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            acquire.add_done_callback(lambda _: self._ffmpeg_slots.release())
+            raise
+        
+        try:
+            # FFmpeg writes nothing useful to stdout, and with errors-only
+            # logging stderr stays empty unless something goes wrong
+            process = await asyncio.create_subprocess_exec(
+                args[0], *_FFMPEG_QUIET_ARGS, *args[1:],
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await process.communicate()
+        finally:
+            self._ffmpeg_slots.release()
+        
+        if process.returncode != 0:
+            logger.error(f"FFmpeg failed: {stderr.decode(errors='replace').strip()}")
+            raise subprocess.CalledProcessError(process.returncode, args, None, stderr)
+    
     def create_music_and_intro(self, topic: str, prompts: str) -> Dict:
         """
         Generate background music and intro video
         
+        Args:
+            topic: Video topic
+            prompts: Additional prompts for customization
+            
+        Returns:
+            Dictionary with paths to music and intro files
+        """
+        return asyncio.run(self.create_music_and_intro_async(topic, prompts))
+    
+    async def create_music_and_intro_async(self, topic: str, prompts: str) -> Dict:
+        """
+        Generate background music and intro video concurrently
+        
         Args:
             topic: Video topic
             prompts: Additional prompts for customization
@@ -64,20 +298,23 @@ class VideoGenerator:
         
         try:
             # Generate script and visual plan
-            script_data = self._generate_script(topic, prompts)
-            
-            # Generate background music
-            music_path = self._generate_music(
-                mood=script_data.get('mood', 'upbeat'),
-                duration=self.config.get('video_duration', 60)
+            loop = asyncio.get_running_loop()
+            script_data = await loop.run_in_executor(
+                None, self._generate_script, topic, prompts
             )
-            result['music_path'] = music_path
             
-            # Generate intro video
-            intro_path = self._generate_intro(
-                topic=topic,
-                visual_style=script_data.get('visual_style', 'modern')
+            # Music and intro share no data, so render them concurrently
+            music_path, intro_path = await asyncio.gather(
+                self._generate_music(
+                    mood=script_data.get('mood', 'upbeat'),
+                    duration=self.config.get('video_duration', 60)
+                ),
+                self._generate_intro(
+                    topic=topic,
+                    visual_style=script_data.get('visual_style', 'modern')
+                )
             )
+            result['music_path'] = music_path
             result['intro_path'] = intro_path
             
             logger.info("Music and intro created successfully")
@@ -88,30 +325,19 @@ class VideoGenerator:
         
         return result
     
-    def _generate_script(self, topic: str, prompts: str) -> Dict:
+    def _script_prompts(self, topic: str, prompts: str) -> Tuple[str, str]:
         """
-        Generate video script using AI
+        Build the system and user prompts for a script request
         
         Args:
             topic: Video topic
             prompts: Additional context
             
         Returns:
-            Dictionary containing script and metadata
+            Tuple of (system prompt, user prompt)
         """
-        logger.info("Generating video script")
-        
-        system_prompt = """You are an expert video script writer. Create engaging, 
-        concise scripts for YouTube videos. Include visual descriptions, narration, 
-        and pacing suggestions. Return your response in JSON format with the following structure:
-        {
-            "title": "video title",
-            "script": "full narration script",
-            "scenes": [{"narration": "text", "visuals": "description", "duration": seconds}],
-            "mood": "upbeat/calm/dramatic/etc",
-            "visual_style": "modern/cinematic/minimalist/etc",
-            "estimated_duration": seconds
-        }"""
+        # Kept byte-identical across calls so provider prompt caches can hit
+        system_prompt = self.config.get('system_prompt', DEFAULT_SYSTEM_PROMPT)
         
         user_prompt = f"""Create a video script for the following topic:
         
@@ -122,33 +348,92 @@ class VideoGenerator:
         The video should be approximately {self.config.get('video_duration', 60)} seconds long.
         Make it engaging and suitable for YouTube."""
         
-        try:
-            if self.ai_provider == 'anthropic':
-                response = self.ai_client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=2000,
-                    messages=[
-                        {"role": "user", "content": f"{system_prompt}\n\n{user_prompt}"}
-                    ]
-                )
-                script_text = response.content[0].text
-            else:  # OpenAI
-                response = self.ai_client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    temperature=0.7
-                )
-                script_text = response.choices[0].message.content
+        return system_prompt, user_prompt
+    
+    def _complete(self, system_prompt: str, user_prompt: str,
+                  max_tokens: int = SCRIPT_MAX_TOKENS) -> str:
+        """
+        Send a prompt to the configured AI provider
+        
+        Args:
+            system_prompt: Static instructions
+            user_prompt: Request-specific prompt
+            max_tokens: Upper bound on response length
             
+        Returns:
+            JSON text extracted from the response
+        """
+        if self.ai_provider == 'anthropic':
+            # Prompts shorter than the model's minimum cacheable length are
+            # never cached, so only mark a system prompt long enough to be
+            # (the default one is far too short; a custom one may not be)
+            system_block = {"type": "text", "text": system_prompt}
+            if len(system_prompt) >= MIN_CACHEABLE_PROMPT_CHARS:
+                system_block["cache_control"] = {"type": "ephemeral"}
+            
+            response = self.ai_client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=max_tokens,
+                system=[system_block],
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            )
+            text = response.content[0].text
+            cached_tokens = getattr(response.usage, 'cache_read_input_tokens', None)
+        else:  # OpenAI
+            response = self.ai_client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.7
+            )
+            text = response.choices[0].message.content
+            # OpenAI caches matching prompt prefixes of 1024+ tokens automatically
+            details = getattr(response.usage, 'prompt_tokens_details', None)
+            cached_tokens = getattr(details, 'cached_tokens', None)
+        
+        if cached_tokens:
+            logger.info(f"Prompt cache hit: {cached_tokens} cached input tokens")
+        
+        match = _JSON_PAYLOAD.search(text)
+        return match.group(0) if match else text
+    
+    def _generate_script(self, topic: str, prompts: str) -> Dict:
+        """
+        Generate video script using AI
+        
+        Args:
+            topic: Video topic
+            prompts: Additional context
+            
+        Returns:
+            Dictionary containing script and metadata
+        """
+        logger.info("Generating video script")
+        
+        system_prompt, user_prompt = self._script_prompts(topic, prompts)
+        
+        cache_path = self._cache_path('script', '.json', system_prompt, user_prompt)
+        if self.cache_enabled:
+            script_data = self._read_cached_script(cache_path)
+            if script_data is not None:
+                logger.info(f"Using cached script: {script_data['title']}")
+                return script_data
+        
+        try:
             # Parse JSON response
-            # Remove markdown code blocks if present
-            script_text = script_text.replace('```json', '').replace('```', '').strip()
-            script_data = json.loads(script_text)
+            script_data = _loads(self._complete(system_prompt, user_prompt))
             
             logger.info(f"Generated script: {script_data['title']}")
+            
+            # Only real responses are cached; the fallback below is not
+            if self.cache_enabled:
+                self._write_cached_script(cache_path, script_data)
+            
             return script_data
             
         except Exception as e:
@@ -163,7 +448,129 @@ class VideoGenerator:
                 "estimated_duration": 60
             }
     
-    def _generate_music(self, mood: str, duration: int) -> Optional[str]:
+    def prefetch_scripts(self, topics: List[Tuple[str, str]]) -> int:
+        """
+        Generate scripts for several videos with one AI request per batch
+        
+        Results go into the script cache, so the per-video _generate_script
+        calls made later in the pipeline are served without a round trip.
+        Videos that already have a cached script are left out of the request.
+        
+        Args:
+            topics: List of (topic, prompts) tuples
+            
+        Returns:
+            Number of scripts generated and cached
+        """
+        if not self.cache_enabled:
+            return 0
+        
+        missing = []
+        for topic, prompts in topics:
+            system_prompt, user_prompt = self._script_prompts(topic, prompts)
+            cache_path = self._cache_path('script', '.json', system_prompt, user_prompt)
+            if not cache_path.exists():
+                missing.append((user_prompt, cache_path))
+        
+        # Keep each response within the model's output limit
+        size = max(1, self.script_batch_size)
+        return sum(
+            self._prefetch_script_batch(system_prompt, missing[n:n + size])
+            for n in range(0, len(missing), size)
+        )
+    
+    def _prefetch_script_batch(self, system_prompt: str,
+                               batch: List[Tuple[str, Path]]) -> int:
+        """
+        Generate and cache one batch of scripts with a single AI request
+        
+        Args:
+            system_prompt: Script system prompt shared by every request
+            batch: (user prompt, cache path) pairs
+            
+        Returns:
+            Number of scripts generated and cached
+        """
+        # A single script gains nothing from batching
+        if len(batch) < 2:
+            return 0
+        
+        logger.info(f"Generating {len(batch)} video scripts in one request")
+        
+        batch_prompt = "\n\n".join(
+            f"Request {i}:\n{user_prompt}"
+            for i, (user_prompt, _) in enumerate(batch, start=1)
+        )
+        
+        try:
+            scripts = _loads(self._complete(
+                system_prompt + BATCH_SCRIPT_INSTRUCTIONS.format(count=len(batch)),
+                batch_prompt,
+                max_tokens=SCRIPT_MAX_TOKENS * len(batch)
+            ))
+        except Exception as e:
+            logger.warning(f"Batch script generation failed: {str(e)}")
+            return 0
+        
+        if not isinstance(scripts, list) or len(scripts) != len(batch):
+            logger.warning("Batch script response did not match the request; ignoring it")
+            return 0
+        
+        cached = 0
+        for (_, cache_path), script_data in zip(batch, scripts):
+            if isinstance(script_data, dict) and 'title' in script_data:
+                self._write_cached_script(cache_path, script_data)
+                cached += 1
+        
+        return cached
+    
+    def _read_cached_script(self, cache_path: Path) -> Optional[Dict]:
+        """
+        Load a script from the cache
+        
+        Args:
+            cache_path: Location from _cache_path
+            
+        Returns:
+            Cached script, or None if it is missing or unreadable
+        """
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)['script']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cached script: {str(e)}")
+            return None
+    
+    def _write_cached_script(self, cache_path: Path, script_data: Dict):
+        """
+        Save a generated script to the cache
+        
+        Args:
+            cache_path: Destination from _cache_path
+            script_data: Parsed script returned by the AI provider
+        """
+        entry = {
+            'provider': self.ai_provider,
+            'cache_version': CACHE_VERSION,
+            'created': datetime.now().isoformat(),
+            'script': script_data
+        }
+        
+        # Unique per thread, like store_cached_file, so workers caching the
+        # same script never write to one temp file
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp, cache_path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to cache script: {str(e)}")
+            tmp.unlink(missing_ok=True)
+    
+    async def _generate_music(self, mood: str, duration: int) -> Optional[str]:
         """
         Generate or select background music
         
@@ -183,15 +590,9 @@ class VideoGenerator:
         # - Soundraw
         # - Or use royalty-free music libraries
         
-        music_path = self.output_dir / f"music_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
-        
-        # Create a silent audio file as placeholder (using FFmpeg)
+        # Use shared silent audio as placeholder
         try:
-            subprocess.run([
-                'ffmpeg', '-f', 'lavfi', '-i', f'anullsrc=r=44100:cl=stereo',
-                '-t', str(duration), '-c:a', 'libmp3lame', '-b:a', '128k',
-                str(music_path), '-y'
-            ], check=True, capture_output=True)
+            music_path = await self._silent_audio(duration)
             
             logger.info(f"Music file created: {music_path}")
             return str(music_path)
@@ -200,7 +601,37 @@ class VideoGenerator:
             logger.error(f"Error creating music file: {str(e)}")
             return None
     
-    def _generate_intro(self, topic: str, visual_style: str) -> Optional[str]:
+    async def _silent_audio(self, duration: int) -> Path:
+        """
+        Get a silent MP3 of the given length, encoding it only the first time
+        
+        Args:
+            duration: Duration in seconds
+            
+        Returns:
+            Path to the shared silent audio file
+        """
+        silence_path = self.output_dir / ".cache" / f"silence_{duration}s.mp3"
+        if silence_path.exists():
+            return silence_path
+        
+        silence_path.parent.mkdir(exist_ok=True)
+        # Workers may race to create the same file; each renders to its own
+        # temp name and the last rename wins
+        tmp = silence_path.with_name(
+            f"{silence_path.name}.{os.getpid()}.{threading.get_ident()}.tmp.mp3"
+        )
+        
+        await self._run_ffmpeg([
+            'ffmpeg', '-f', 'lavfi', '-i', 'anullsrc=r=44100:cl=stereo',
+            '-t', str(duration), '-c:a', 'libmp3lame', '-b:a', '128k',
+            str(tmp), '-y'
+        ])
+        os.replace(tmp, silence_path)
+        
+        return silence_path
+    
+    async def _generate_intro(self, topic: str, visual_style: str) -> Optional[str]:
         """
         Generate intro video
         
@@ -213,7 +644,7 @@ class VideoGenerator:
         """
         logger.info(f"Generating intro with style: {visual_style}")
         
-        intro_path = self.output_dir / f"intro_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
+        intro_path = self._output_path("intro", ".mp4")
         
         # Create a simple intro using FFmpeg
         # In production, use video generation APIs like:
@@ -222,15 +653,16 @@ class VideoGenerator:
         # - Runway ML
         # - Pictory
         
+        text_file = self._write_overlay_text(topic)
         try:
             # Create a 5-second intro with text
-            subprocess.run([
+            await self._run_ffmpeg([
                 'ffmpeg',
-                '-f', 'lavfi', '-i', 'color=c=black:s=1920x1080:d=5',
-                '-vf', f"drawtext=text='{topic}':fontsize=72:fontcolor=white:x=(w-text_w)/2:y=(h-text_h)/2",
-                '-c:v', 'libx264', '-t', '5', '-pix_fmt', 'yuv420p',
+                '-f', 'lavfi', '-i', COLOR_SOURCE.format(color='black', duration=5),
+                '-vf', INTRO_TEXT_FILTER.format(str(text_file).translate(_FILTER_ESCAPES)),
+                *PLACEHOLDER_VIDEO_ARGS, '-t', '5',
                 str(intro_path), '-y'
-            ], check=True, capture_output=True)
+            ])
             
             logger.info(f"Intro video created: {intro_path}")
             return str(intro_path)
@@ -238,6 +670,8 @@ class VideoGenerator:
         except subprocess.CalledProcessError as e:
             logger.error(f"Error creating intro: {str(e)}")
             return None
+        finally:
+            text_file.unlink(missing_ok=True)
     
     def generate_full_video(self, topic: str, prompts: str, 
                           music_path: Optional[str] = None,
@@ -245,6 +679,25 @@ class VideoGenerator:
         """
         Generate complete video with all components
         
+        Args:
+            topic: Video topic
+            prompts: Additional prompts
+            music_path: Path to background music
+            intro_path: Path to intro video
+            
+        Returns:
+            Dictionary with video information
+        """
+        return asyncio.run(self.generate_full_video_async(
+            topic, prompts, music_path=music_path, intro_path=intro_path
+        ))
+    
+    async def generate_full_video_async(self, topic: str, prompts: str,
+                                        music_path: Optional[str] = None,
+                                        intro_path: Optional[str] = None) -> Dict:
+        """
+        Generate complete video, rendering independent components concurrently
+        
         Args:
             topic: Video topic
             prompts: Additional prompts
@@ -258,16 +711,19 @@ class VideoGenerator:
         
         try:
             # Generate full script if not already done
-            script_data = self._generate_script(topic, prompts)
-            
-            # Generate scenes
-            scene_videos = self._generate_scenes(script_data['scenes'])
+            loop = asyncio.get_running_loop()
+            script_data = await loop.run_in_executor(
+                None, self._generate_script, topic, prompts
+            )
             
-            # Generate voiceover
-            voiceover_path = self._generate_voiceover(script_data['script'])
+            # Scenes and voiceover both depend only on the script
+            scene_videos, voiceover_path = await asyncio.gather(
+                self._generate_scenes(script_data['scenes']),
+                self._generate_voiceover(script_data['script'])
+            )
             
             # Combine all elements
-            final_video_path = self._combine_video_elements(
+            final_video_path = await self._combine_video_elements(
                 scene_videos=scene_videos,
                 voiceover=voiceover_path,
                 music=music_path,
@@ -290,7 +746,7 @@ class VideoGenerator:
             logger.error(f"Error generating full video: {str(e)}")
             raise
     
-    def _generate_scenes(self, scenes: List[Dict]) -> List[str]:
+    async def _generate_scenes(self, scenes: List[Dict]) -> List[str]:
         """
         Generate video clips for each scene
         
@@ -300,41 +756,84 @@ class VideoGenerator:
         Returns:
             List of paths to scene video files
         """
-        scene_videos = []
+        # Each FFmpeg process encodes a batch of scenes, so process start-up
+        # is paid once per batch. Batches render concurrently; _run_ffmpeg
+        # caps the processes across all videos at the core count.
+        indexed = list(enumerate(scenes))
+        size = max(1, self.scene_batch_size)
+        batches = [indexed[n:n + size] for n in range(0, len(indexed), size)]
+        
+        rendered = await asyncio.gather(*[
+            self._render_scene_batch(batch, len(scenes))
+            for batch in batches
+        ])
+        
+        # gather keeps input order; drop scenes that failed to render
+        return [path for paths in rendered for path in paths if path]
+    
+    async def _render_scene_batch(self, batch: List[Tuple[int, Dict]],
+                                  total: int) -> List[Optional[str]]:
+        """
+        Render several scene clips with one FFmpeg process
         
-        for i, scene in enumerate(scenes):
-            logger.info(f"Generating scene {i+1}/{len(scenes)}")
-            
-            # In production, use image/video generation APIs:
-            # - Stable Diffusion
-            # - DALL-E
-            # - Midjourney
-            # - Runway ML
-            
-            # For now, create placeholder scenes
-            scene_path = self.output_dir / f"scene_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
+        If the combined command fails, each scene is retried on its own so
+        one bad scene does not take the rest of the batch with it.
+        
+        Args:
+            batch: (index, scene) pairs in script order
+            total: Number of scenes being rendered
             
+        Returns:
+            Path to each scene video file, or None where rendering failed
+        """
+        # In production, use image/video generation APIs:
+        # - Stable Diffusion
+        # - DALL-E
+        # - Midjourney
+        # - Runway ML
+        
+        # For now, create placeholder scenes with a text overlay
+        scene_paths = [self._output_path(f"scene_{index}", ".mp4") for index, _ in batch]
+        text_files = [
+            self._write_overlay_text(scene.get('visuals', f'Scene {index+1}')[:50])
+            for index, scene in batch
+        ]
+        
+        inputs = []
+        outputs = []
+        for input_index, ((_, scene), text_file, scene_path) in enumerate(
+                zip(batch, text_files, scene_paths)):
             duration = scene.get('duration', 5)
-            visual_text = scene.get('visuals', f'Scene {i+1}')
-            
-            try:
-                # Create scene with text overlay
-                subprocess.run([
-                    'ffmpeg',
-                    '-f', 'lavfi', '-i', f'color=c=blue:s=1920x1080:d={duration}',
-                    '-vf', f"drawtext=text='{visual_text[:50]}':fontsize=48:fontcolor=white:x=(w-text_w)/2:y=(h-text_h)/2",
-                    '-c:v', 'libx264', '-t', str(duration), '-pix_fmt', 'yuv420p',
-                    str(scene_path), '-y'
-                ], check=True, capture_output=True)
-                
-                scene_videos.append(str(scene_path))
-                
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Error creating scene {i}: {str(e)}")
+            inputs.extend(['-f', 'lavfi', '-i', COLOR_SOURCE.format(color='blue', duration=duration)])
+            outputs.extend([
+                '-map', f'{input_index}:v',
+                '-vf', SCENE_TEXT_FILTER.format(str(text_file).translate(_FILTER_ESCAPES)),
+                *PLACEHOLDER_VIDEO_ARGS, '-t', str(duration),
+                str(scene_path)
+            ])
+        
+        first, last = batch[0][0], batch[-1][0]
         
-        return scene_videos
+        logger.info(f"Generating scenes {first+1}-{last+1}/{total}")
+        
+        try:
+            await self._run_ffmpeg(['ffmpeg', '-y', *inputs, *outputs])
+            return [str(scene_path) for scene_path in scene_paths]
+            
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Error creating scenes {first}-{last}: {str(e)}")
+            if len(batch) == 1:
+                return [None]
+        finally:
+            for text_file in text_files:
+                text_file.unlink(missing_ok=True)
+        
+        rendered = await asyncio.gather(*[
+            self._render_scene_batch([item], total) for item in batch
+        ])
+        return [path for paths in rendered for path in paths]
     
-    def _generate_voiceover(self, script: str) -> Optional[str]:
+    async def _generate_voiceover(self, script: str) -> Optional[str]:
         """
         Generate voiceover audio from script
         
@@ -346,38 +845,52 @@ class VideoGenerator:
         """
         logger.info("Generating voiceover")
         
-        voiceover_path = self.output_dir / f"voiceover_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
+        voiceover_path = self._output_path("voiceover", ".mp3")
         
         try:
             # Use text-to-speech service
             # Options: OpenAI TTS, ElevenLabs, Google TTS, Azure TTS
             
             if hasattr(self.ai_client, 'audio') and self.ai_provider == 'openai':
-                response = self.ai_client.audio.speech.create(
-                    model="tts-1",
-                    voice="alloy",
-                    input=script
-                )
-                response.stream_to_file(str(voiceover_path))
+                cache_path = self._cache_path('voiceover', '.mp3', 'tts-1', 'alloy', script)
+                if self.cache_enabled and cache_path.exists():
+                    logger.info(f"Using cached voiceover: {cache_path}")
+                    return str(cache_path)
+                
+                def synthesize():
+                    # Write audio chunks as they arrive instead of buffering
+                    # the whole response body in memory first
+                    with self.ai_client.audio.speech.with_streaming_response.create(
+                        model="tts-1",
+                        voice="alloy",
+                        input=script
+                    ) as response:
+                        response.stream_to_file(str(voiceover_path))
+                
+                # The TTS client is blocking, so keep it off the event loop
+                await asyncio.get_running_loop().run_in_executor(None, synthesize)
+                
+                if self.cache_enabled:
+                    try:
+                        store_cached_file(voiceover_path, cache_path)
+                    except OSError as e:
+                        logger.warning(f"Failed to cache {cache_path.name}: {str(e)}")
+                
                 logger.info(f"Voiceover created: {voiceover_path}")
                 return str(voiceover_path)
             else:
-                # Fallback: create silent audio
-                subprocess.run([
-                    'ffmpeg', '-f', 'lavfi', '-i', 'anullsrc=r=44100:cl=stereo',
-                    '-t', '60', '-c:a', 'libmp3lame', str(voiceover_path), '-y'
-                ], check=True, capture_output=True)
-                return str(voiceover_path)
+                # Fallback: silent audio
+                return str(await self._silent_audio(60))
                 
         except Exception as e:
             logger.error(f"Error generating voiceover: {str(e)}")
             return None
     
-    def _combine_video_elements(self, scene_videos: List[str], 
-                               voiceover: Optional[str],
-                               music: Optional[str],
-                               intro: Optional[str],
-                               topic: str) -> str:
+    async def _combine_video_elements(self, scene_videos: List[str], 
+                                     voiceover: Optional[str],
+                                     music: Optional[str],
+                                     intro: Optional[str],
+                                     topic: str) -> str:
         """
         Combine all video elements into final video
         
@@ -393,55 +906,60 @@ class VideoGenerator:
         """
         logger.info("Combining video elements")
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        final_path = self.output_dir / f"final_{topic.replace(' ', '_')}_{timestamp}.mp4"
+        final_path = self._output_path(f"final_{topic.replace(' ', '_')}", ".mp4")
         
         try:
             # Create concat file for scenes
-            concat_file = self.output_dir / f"concat_{timestamp}.txt"
+            concat_file = self._output_path("concat", ".txt")
             with open(concat_file, 'w') as f:
                 if intro:
                     f.write(f"file '{intro}'\n")
                 for scene in scene_videos:
                     f.write(f"file '{scene}'\n")
             
-            # Concatenate videos
-            temp_video = self.output_dir / f"temp_video_{timestamp}.mp4"
-            subprocess.run([
-                'ffmpeg', '-f', 'concat', '-safe', '0', '-i', str(concat_file),
-                '-c', 'copy', str(temp_video), '-y'
-            ], check=True, capture_output=True)
-            
-            # Add audio tracks
+            # Concatenate and mix audio in a single pass. The concat demuxer
+            # feeds the video stream straight through, so there is no
+            # intermediate file to write and read back.
             audio_inputs = []
+            audio_labels = []
             audio_filters = []
             
             if voiceover:
                 audio_inputs.extend(['-i', voiceover])
-                audio_filters.append('[1:a]')
+                audio_labels.append(f'[{len(audio_labels) + 1}:a]')
             
             if music:
                 audio_inputs.extend(['-i', music])
-                audio_filters.append('[2:a]volume=0.3')  # Lower music volume
+                audio_filters.append(f'[{len(audio_labels) + 1}:a]volume=0.3[music]')  # Lower music volume
+                audio_labels.append('[music]')
             
-            if audio_inputs:
+            command = [
+                'ffmpeg', '-f', 'concat', '-safe', '0', '-i', str(concat_file),
+                *audio_inputs
+            ]
+            
+            if voiceover and not music:
+                # A single track needs no mixing; mux it as-is instead of
+                # decoding and re-encoding it
+                command.extend(['-map', '0:v', '-map', '1:a', '-c', 'copy'])
+            elif audio_labels:
                 # Mix audio tracks
-                filter_complex = f"{''.join(audio_filters)}amix=inputs={len(audio_filters)}:duration=first[aout]"
-                
-                subprocess.run([
-                    'ffmpeg', '-i', str(temp_video), *audio_inputs,
-                    '-filter_complex', filter_complex,
+                audio_filters.append(
+                    f"{''.join(audio_labels)}amix=inputs={len(audio_labels)}:duration=first[aout]"
+                )
+                command.extend([
+                    '-filter_complex', ';'.join(audio_filters),
                     '-map', '0:v', '-map', '[aout]',
-                    '-c:v', 'copy', '-c:a', 'aac', '-b:a', '192k',
-                    str(final_path), '-y'
-                ], check=True, capture_output=True)
+                    '-c:v', 'copy', '-c:a', 'aac', '-b:a', '192k'
+                ])
             else:
                 # No audio, just copy
-                os.rename(temp_video, final_path)
+                command.extend(['-c', 'copy'])
+            
+            await self._run_ffmpeg([*command, str(final_path), '-y'])
             
             # Clean up temporary files
             concat_file.unlink(missing_ok=True)
-            temp_video.unlink(missing_ok=True)
             
             logger.info(f"Final video created: {final_path}")
             return str(final_path)
@@ -4,77 +4,432 @@ Handles uploading videos to YouTube using the YouTube Data API
 """
 
 import os
+import sys
+import json
+import time
+import random
+import socket
 import logging
-import pickle
+import functools
+import threading
+import unicodedata
+import http.client
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from typing import Any, Dict, List, Optional, Tuple
+# The discovery, transport and OAuth modules are imported where they are
+# first needed, so the CLI help path and importers that never upload don't
+# pay for loading them. googleapiclient.errors is small and needed by the
+# except clauses below.
 from googleapiclient.errors import HttpError
 
+try:
+    import regex  # Optional, exact grapheme cluster matching
+except ImportError:
+    regex = None
+
 logger = logging.getLogger(__name__)
 
+# Resumable upload chunks must be a multiple of 256 KiB
+CHUNK_GRANULARITY = 256 * 1024
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Errors worth retrying a chunk for; the upload resumes from the last byte
+# the server acknowledged. Metadata calls retry the same status codes.
+RETRIABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+RETRIABLE_EXCEPTIONS = (IOError, http.client.HTTPException)
+MAX_CHUNK_RETRIES = 10
+MAX_API_RETRIES = 3
+
+# Socket timeout for API requests, in seconds
+HTTP_TIMEOUT = 60
+
+# Minimum seconds between upload progress log lines
+PROGRESS_LOG_INTERVAL = 5.0
+
+# YouTube snippet limits, in characters
+MAX_TITLE_LENGTH = 100
+MAX_DESCRIPTION_LENGTH = 5000
+# Combined length of all tags; a tag containing a space counts its quotes,
+# and tags are separated by commas
+MAX_TAGS_LENGTH = 500
+
+VALID_PRIVACY_STATUSES = frozenset({'public', 'private', 'unlisted'})
+
+# Code points that attach to the preceding character: zero-width joiner,
+# variation selectors and emoji skin tone modifiers
+_GRAPHEME_EXTENDERS = frozenset(
+    ['\u200d', '\ufe0e', '\ufe0f'] + [chr(c) for c in range(0x1F3FB, 0x1F400)]
+)
+
+# Most IDs accepted by videos.list, and most calls in one batch request
+MAX_IDS_PER_REQUEST = 50
+
+# Authorized credentials and built services shared by every uploader in the
+# process, keyed by (client secrets path, scopes)
+_SERVICE_CACHE: Dict[Tuple[str, Tuple[str, ...]], Tuple[Any, Any]] = {}
+_SERVICE_CACHE_LOCK = threading.Lock()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """
+    Shorten text to at most limit characters without splitting a grapheme
+    
+    Args:
+        text: Text to shorten
+        limit: Maximum length in characters
+        
+    Returns:
+        The original string if it already fits, otherwise the longest prefix
+        that ends on a grapheme cluster boundary
+    """
+    if len(text) <= limit:
+        return text
+    
+    if regex is not None:
+        end = 0
+        for match in regex.finditer(r'\X', text):
+            if match.end() > limit:
+                break
+            end = match.end()
+        return text[:end]
+    
+    # Without the regex module, back off over combining marks, emoji joiners
+    # and modifiers, and stop between the two halves of a flag
+    end = limit
+    while end > 0 and (text[end] in _GRAPHEME_EXTENDERS or unicodedata.combining(text[end])
+                       or text[end - 1] == '\u200d'):
+        end -= 1
+    
+    regional_indicators = 0
+    while end - regional_indicators > 0 and '\U0001F1E6' <= text[end - regional_indicators - 1] <= '\U0001F1FF':
+        regional_indicators += 1
+    if regional_indicators % 2:
+        end -= 1
+    
+    return text[:end]
+
+
+def _validate_metadata(category: Optional[str] = None,
+                       privacy_status: Optional[str] = None,
+                       tags: Optional[list] = None) -> None:
+    """
+    Reject metadata the API would refuse, before anything is sent
+    
+    Args:
+        category: YouTube category ID
+        privacy_status: 'public', 'private', or 'unlisted'
+        tags: List of tags
+        
+    Raises:
+        ValueError: If a value is invalid
+    """
+    if privacy_status is not None and privacy_status not in VALID_PRIVACY_STATUSES:
+        raise ValueError(
+            f"Invalid privacy status {privacy_status!r}; "
+            f"expected one of {', '.join(sorted(VALID_PRIVACY_STATUSES))}"
+        )
+    
+    # Which categories are assignable depends on the region, but IDs are
+    # always numeric
+    if category is not None and not str(category).isdigit():
+        raise ValueError(f"Invalid category ID: {category!r}")
+    
+    if tags:
+        tags_length = len(tags) - 1 + sum(len(tag) + (2 if ' ' in tag else 0) for tag in tags)
+        if tags_length > MAX_TAGS_LENGTH:
+            raise ValueError(
+                f"Tags are {tags_length} characters combined; YouTube allows {MAX_TAGS_LENGTH}"
+            )
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with jitter, in seconds, capped at about a minute"""
+    return min(2 ** attempt, 64) + random.random()
+
+
+def _api_call(action: str, retries: int = 0):
+    """
+    Decorate an uploader method with the shared YouTube API error handling
+    
+    Errors are logged and re-raised. HttpErrors with a status in
+    RETRIABLE_STATUS_CODES are retried with backoff first; only pass retries
+    for calls that are safe to repeat.
+    
+    Args:
+        action: What the method does, used in log messages
+        retries: Number of times to retry a transient API error
+        
+    Returns:
+        Decorator for the method
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            for attempt in range(retries + 1):
+                try:
+                    return method(*args, **kwargs)
+                except HttpError as e:
+                    if e.resp.status in RETRIABLE_STATUS_CODES and attempt < retries:
+                        delay = _backoff(attempt)
+                        logger.warning("YouTube API error %s (%s), retrying in %.1fs", action, e, delay)
+                        time.sleep(delay)
+                        continue
+                    logger.error("YouTube API error: %s", e)
+                    raise
+                except Exception as e:
+                    logger.error("Error %s: %s", action, e)
+                    raise
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _media_upload_classes() -> Tuple[type, type]:
+    """
+    Import MediaFileUpload and build the read-ahead subclass on first use
+    
+    Returns:
+        Tuple of (MediaFileUpload, PrefetchingMediaFileUpload)
+    """
+    from googleapiclient.http import MediaFileUpload
+    
+    class PrefetchingMediaFileUpload(MediaFileUpload):
+        """MediaFileUpload that reads the next chunk from disk while the current one is sent"""
+        
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            self._prefetch = None  # (begin, length, future)
+            
+            # The file is read front to back exactly once; let the kernel use
+            # its larger sequential readahead window
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(self._fd.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+        
+        def has_stream(self) -> bool:
+            # Make next_chunk request chunks through getbytes, where they can be
+            # served from the read-ahead buffer
+            return False
+        
+        def _read(self, begin: int, length: int) -> bytes:
+            # pread leaves the file position alone, so the read-ahead thread
+            # never races with the caller
+            return os.pread(self._fd.fileno(), length, begin)
+        
+        def getbytes(self, begin: int, length: int) -> bytes:
+            prefetch, self._prefetch = self._prefetch, None
+            if prefetch and prefetch[:2] == (begin, length):
+                data = prefetch[2].result()
+            else:
+                # First chunk, or the upload resumed from a different offset
+                data = self._read(begin, length)
+            
+            next_begin = begin + len(data)
+            if len(data) == length and next_begin < self.size():
+                self._prefetch = (
+                    next_begin, length,
+                    self._prefetch_executor.submit(self._read, next_begin, length)
+                )
+            
+            return data
+        
+        def close(self):
+            """Stop the read-ahead thread and close the file"""
+            self._prefetch = None
+            self._prefetch_executor.shutdown(wait=True)
+            self._fd.close()
+    
+    return MediaFileUpload, PrefetchingMediaFileUpload
+
+
+def _tune_socket(sock) -> None:
+    """Disable Nagle's algorithm on a connected socket"""
+    # SO_SNDBUF is deliberately left alone: setting it turns off the
+    # kernel's send buffer autotuning, which on Linux grows well past the
+    # largest value an unprivileged setsockopt can set
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError):
+        # Not a TCP socket (e.g. proxied), or the option isn't supported
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _tuned_http_class() -> type:
+    """
+    Import httplib2 and build an Http subclass that tunes each new connection
+    
+    Returns:
+        Http subclass whose sockets have TCP_NODELAY set
+    """
+    import httplib2
+    
+    class TunedHttp(httplib2.Http):
+        """httplib2.Http that sets socket options as soon as a connection opens"""
+        
+        def _conn_request(self, conn, request_uri, method, body, headers):
+            # httplib2 opens and reopens connections inside _conn_request, with
+            # its own error handling; hook connect() on each pooled connection
+            # once so every socket it opens is tuned before the first byte
+            if not getattr(conn, '_socket_tuned', False):
+                connect = conn.connect
+                
+                def tuned_connect():
+                    connect()
+                    _tune_socket(conn.sock)
+                
+                conn.connect = tuned_connect
+                conn._socket_tuned = True
+            return super()._conn_request(conn, request_uri, method, body, headers)
+    
+    return TunedHttp
+
 
 class YouTubeUploader:
     """Upload videos to YouTube"""
     
     SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
     
-    def __init__(self, client_secrets_file: str):
+    def __init__(self, client_secrets_file: str, chunk_size: Optional[int] = None):
         """
         Initialize YouTube uploader
         
         Args:
             client_secrets_file: Path to OAuth2 client secrets JSON file
+            chunk_size: Resumable upload chunk size in bytes, a multiple of
+                256 KiB. Defaults to YOUTUBE_UPLOAD_CHUNK_SIZE or 8 MiB;
+                larger chunks upload faster on fast links.
         """
+        if chunk_size is None:
+            chunk_size = int(os.getenv('YOUTUBE_UPLOAD_CHUNK_SIZE', DEFAULT_CHUNK_SIZE))
+        if chunk_size <= 0 or chunk_size % CHUNK_GRANULARITY:
+            raise ValueError(
+                f"Upload chunk size must be a positive multiple of {CHUNK_GRANULARITY} bytes, "
+                f"got {chunk_size}"
+            )
+        
         self.client_secrets_file = client_secrets_file
+        self.chunk_size = chunk_size
         self.credentials = None
         self.youtube = None
+        # httplib2.Http is not thread-safe, so each thread gets its own
+        # authorized transport and keeps reusing its open connection
+        self._local = threading.local()
         self._authenticate()
     
     def _authenticate(self):
-        """Authenticate with YouTube API"""
-        token_file = 'youtube_token.pickle'
+        """Authenticate with YouTube API, reusing this process's earlier login if still valid"""
+        key = (os.path.abspath(self.client_secrets_file), tuple(self.SCOPES))
+        
+        # Held for the whole login so concurrent constructors don't each run
+        # the OAuth flow
+        with _SERVICE_CACHE_LOCK:
+            cached = _SERVICE_CACHE.get(key)
+            if cached and cached[0].valid:
+                self.credentials, self.youtube = cached
+                logger.info("Reusing YouTube service")
+                return
+            
+            self._authorize()
+            _SERVICE_CACHE[key] = (self.credentials, self.youtube)
+    
+    def _authorize(self):
+        """Load, refresh or obtain credentials and build the YouTube service"""
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        
+        token_file = 'youtube_token.json'
+        legacy_token_file = 'youtube_token.pickle'
+        
+        # Headless/CI: the contents of a youtube_token.json generated once on
+        # a machine with a browser, passed in through the environment
+        token_json = os.getenv('YOUTUBE_REFRESH_TOKEN_JSON')
         
         # Load existing credentials
-        if os.path.exists(token_file):
-            with open(token_file, 'rb') as token:
-                self.credentials = pickle.load(token)
+        if token_json:
+            self.credentials = Credentials.from_authorized_user_info(
+                json.loads(token_json), self.SCOPES
+            )
+            token_file = None  # Nothing to persist; the environment is the source
+        else:
+            try:
+                self.credentials = Credentials.from_authorized_user_file(token_file, self.SCOPES)
+            except FileNotFoundError:
+                if os.path.exists(legacy_token_file):
+                    # One-time migration from the old pickle token; it is
+                    # rewritten as JSON below and not read again
+                    import pickle
+                    with open(legacy_token_file, 'rb') as token:
+                        self.credentials = pickle.load(token)
+                    with open(token_file, 'w') as token:
+                        token.write(self.credentials.to_json())
+                    os.remove(legacy_token_file)
+                    logger.info("Migrated YouTube token to JSON")
         
         # Refresh or get new credentials
         if not self.credentials or not self.credentials.valid:
-            if self.credentials and self.credentials.expired and self.credentials.refresh_token:
+            # A token loaded without an access token or expiry is not marked
+            # expired, so refresh whenever a refresh token is available
+            if self.credentials and self.credentials.refresh_token:
                 try:
                     self.credentials.refresh(Request())
                     logger.info("Refreshed YouTube credentials")
                 except Exception as e:
-                    logger.error(f"Failed to refresh credentials: {str(e)}")
+                    logger.error("Failed to refresh credentials: %s", e)
                     self.credentials = None
             
             if not self.credentials:
-                if not os.path.exists(self.client_secrets_file):
-                    logger.error(f"Client secrets file not found: {self.client_secrets_file}")
+                # The browser flow would wait forever without a user
+                if token_json or not sys.stdin.isatty():
+                    raise RuntimeError(
+                        "No valid YouTube credentials and no terminal for the browser login. "
+                        "Authorize once on a machine with a browser, then pass the contents "
+                        "of youtube_token.json in YOUTUBE_REFRESH_TOKEN_JSON."
+                    )
+                
+                try:
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        self.client_secrets_file, self.SCOPES
+                    )
+                except FileNotFoundError:
+                    logger.error("Client secrets file not found: %s", self.client_secrets_file)
                     raise FileNotFoundError(
                         f"YouTube client secrets not found. Please download from Google Cloud Console."
                     )
                 
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.client_secrets_file, self.SCOPES
-                )
                 self.credentials = flow.run_local_server(port=0)
                 logger.info("Obtained new YouTube credentials")
             
             # Save credentials for future use
-            with open(token_file, 'wb') as token:
-                pickle.dump(self.credentials, token)
+            if token_file:
+                with open(token_file, 'w') as token:
+                    token.write(self.credentials.to_json())
         
-        # Build YouTube service
-        self.youtube = build('youtube', 'v3', credentials=self.credentials)
+        # Build YouTube service from the discovery document bundled with
+        # google-api-python-client, so startup makes no discovery request
+        self.youtube = build('youtube', 'v3', credentials=self.credentials,
+                             static_discovery=True)
         logger.info("YouTube service initialized")
     
+    def _http(self):
+        """Get this thread's pooled, authorized HTTP transport"""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import google_auth_httplib2
+            
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=_tuned_http_class()(timeout=HTTP_TIMEOUT)
+            )
+            self._local.http = http
+        return http
+    
+    @_api_call("uploading video")
     def upload_video(self, video_path: str, title: str, description: str,
                     category: str = "22", privacy_status: str = "private",
                     tags: Optional[list] = None) -> Dict:
@@ -92,131 +447,218 @@ class YouTubeUploader:
         Returns:
             Dictionary with upload results including video ID and URL
         """
-        logger.info(f"Uploading video to YouTube: {title}")
+        logger.info("Uploading video to YouTube: %s", title)
         
-        if not os.path.exists(video_path):
-            raise FileNotFoundError(f"Video file not found: {video_path}")
+        # Catch invalid metadata now rather than after sending the whole file
+        _validate_metadata(category, privacy_status, tags)
         
+        # One stat for both the existence check and the size
         try:
-            # Prepare video metadata
-            body = {
-                'snippet': {
-                    'title': title[:100],  # YouTube title limit
-                    'description': description[:5000],  # YouTube description limit
-                    'tags': tags or [],
-                    'categoryId': category
-                },
-                'status': {
-                    'privacyStatus': privacy_status,
-                    'selfDeclaredMadeForKids': False
-                }
+            file_size = os.stat(video_path).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        
+        if not file_size:
+            raise ValueError(f"Video file is empty: {video_path}")
+        
+        logger.info("Video file size: %.1f MiB", file_size / (1024 * 1024))
+        
+        # Prepare video metadata
+        body = {
+            'snippet': {
+                'title': _truncate(title, MAX_TITLE_LENGTH),
+                'description': _truncate(description, MAX_DESCRIPTION_LENGTH),
+                'tags': tags or [],
+                'categoryId': category
+            },
+            'status': {
+                'privacyStatus': privacy_status,
+                'selfDeclaredMadeForKids': False
             }
-            
-            # Create upload request
-            media = MediaFileUpload(
-                video_path,
-                chunksize=-1,  # Upload in a single request
-                resumable=True,
-                mimetype='video/*'
-            )
-            
-            request = self.youtube.videos().insert(
-                part='snippet,status',
-                body=body,
-                media_body=media
-            )
-            
-            # Execute upload with progress tracking
-            response = None
+        }
+        
+        # Create upload request; memory use is bounded by a couple of
+        # chunks and a failed chunk is resumed rather than restarting the
+        # whole file. Where pread is available the next chunk is read
+        # from disk while the current one is on the wire.
+        MediaFileUpload, PrefetchingMediaFileUpload = _media_upload_classes()
+        media_class = PrefetchingMediaFileUpload if hasattr(os, 'pread') else MediaFileUpload
+        media = media_class(
+            video_path,
+            chunksize=self.chunk_size,
+            resumable=True,
+            mimetype='video/*'
+        )
+        
+        request = self.youtube.videos().insert(
+            part='snippet,status',
+            body=body,
+            media_body=media
+        )
+        
+        # Execute upload with progress tracking
+        response = None
+        last_progress = -1
+        last_logged = 0.0
+        try:
             while response is None:
-                status, response = request.next_chunk()
-                if status:
+                status, response = self._next_chunk(request)
+                if status and logger.isEnabledFor(logging.INFO):
+                    # Log only when the percentage moved and not more
+                    # often than PROGRESS_LOG_INTERVAL
                     progress = int(status.progress() * 100)
-                    logger.info(f"Upload progress: {progress}%")
-            
-            video_id = response['id']
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
+                    now = time.monotonic()
+                    if progress != last_progress and now - last_logged >= PROGRESS_LOG_INTERVAL:
+                        logger.info("Upload progress: %d%%", progress)
+                        last_progress = progress
+                        last_logged = now
+        finally:
+            if isinstance(media, PrefetchingMediaFileUpload):
+                media.close()
+        
+        video_id = response['id']
+        video_url = f"https://www.youtube.com/watch?v={video_id}"
+        
+        logger.info("Video uploaded successfully: %s", video_url)
+        
+        return {
+            'id': video_id,
+            'url': video_url,
+            'title': title,
+            'status': 'uploaded',
+            'privacy': privacy_status
+        }
+    
+    def _next_chunk(self, request):
+        """
+        Send the next upload chunk, retrying transient failures with backoff
+        
+        Args:
+            request: Resumable insert request
             
-            logger.info(f"Video uploaded successfully: {video_url}")
+        Returns:
+            (status, response) tuple from next_chunk
+        """
+        for attempt in range(MAX_CHUNK_RETRIES + 1):
+            try:
+                return request.next_chunk(http=self._http())
+            except HttpError as e:
+                if e.resp.status not in RETRIABLE_STATUS_CODES or attempt == MAX_CHUNK_RETRIES:
+                    raise
+                error = e
+            except RETRIABLE_EXCEPTIONS as e:
+                if attempt == MAX_CHUNK_RETRIES:
+                    raise
+                error = e
             
-            return {
-                'id': video_id,
-                'url': video_url,
-                'title': title,
-                'status': 'uploaded',
-                'privacy': privacy_status
-            }
+            delay = _backoff(attempt)
+            logger.warning("Upload chunk failed (%s), retrying in %.1fs", error, delay)
+            time.sleep(delay)
+    
+    def upload_batch(self, videos: List[Dict], max_workers: int = 3) -> List[Dict]:
+        """
+        Upload several videos concurrently
+        
+        Each upload runs in its own thread with its own connection, so session
+        setup, metadata and chunk transfers of different videos overlap.
+        
+        Args:
+            videos: Keyword arguments for upload_video, one dict per video
+            max_workers: Maximum number of simultaneous uploads
             
-        except HttpError as e:
-            logger.error(f"YouTube API error: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Error uploading video: {str(e)}")
-            raise
+        Returns:
+            Upload results in input order; failed uploads are returned as
+            {'status': 'failed', 'error': ...} instead of raising
+        """
+        def upload(video: Dict) -> Dict:
+            try:
+                return self.upload_video(**video)
+            except Exception as e:
+                return {
+                    'title': video.get('title'),
+                    'status': 'failed',
+                    'error': str(e)
+                }
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(upload, videos))
     
+    @_api_call("updating video", retries=MAX_API_RETRIES)
     def update_video(self, video_id: str, title: Optional[str] = None,
                     description: Optional[str] = None,
                     tags: Optional[list] = None,
-                    privacy_status: Optional[str] = None) -> Dict:
+                    privacy_status: Optional[str] = None,
+                    category: Optional[str] = None) -> Dict:
         """
         Update video metadata
         
+        Only the resource parts being changed are read and written back.
+        
         Args:
             video_id: YouTube video ID
             title: New title (optional)
             description: New description (optional)
             tags: New tags (optional)
             privacy_status: New privacy status (optional)
+            category: New category ID (optional)
             
         Returns:
             Updated video information
         """
-        logger.info(f"Updating video: {video_id}")
+        logger.info("Updating video: %s", video_id)
         
-        try:
-            # Get current video details
-            video_response = self.youtube.videos().list(
-                part='snippet,status',
-                id=video_id
-            ).execute()
-            
-            if not video_response['items']:
-                raise ValueError(f"Video not found: {video_id}")
-            
-            video = video_response['items'][0]
-            
-            # Update fields
-            if title:
-                video['snippet']['title'] = title
-            if description:
-                video['snippet']['description'] = description
-            if tags:
-                video['snippet']['tags'] = tags
-            if privacy_status:
-                video['status']['privacyStatus'] = privacy_status
-            
-            # Update video
-            update_response = self.youtube.videos().update(
-                part='snippet,status',
-                body=video
-            ).execute()
-            
-            logger.info(f"Video updated successfully: {video_id}")
-            
-            return {
-                'id': video_id,
-                'url': f"https://www.youtube.com/watch?v={video_id}",
-                'title': update_response['snippet']['title'],
-                'status': 'updated'
-            }
-            
-        except HttpError as e:
-            logger.error(f"YouTube API error: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Error updating video: {str(e)}")
-            raise
+        _validate_metadata(category, privacy_status, tags)
+        
+        snippet_changes = {
+            key: value for key, value in (
+                ('title', title), ('description', description),
+                ('tags', tags), ('categoryId', category)
+            ) if value
+        }
+        
+        parts = []
+        if snippet_changes:
+            parts.append('snippet')
+        if privacy_status:
+            parts.append('status')
+        if not parts:
+            raise ValueError("No video fields to update")
+        
+        # videos.update replaces a whole part, so each part is read first to
+        # keep the fields not set here (e.g. snippet.defaultLanguage and
+        # defaultAudioLanguage, which this method never sets)
+        video_response = self.youtube.videos().list(
+            part=','.join(parts),
+            id=video_id
+        ).execute(http=self._http())
+        
+        if not video_response['items']:
+            raise ValueError(f"Video not found: {video_id}")
+        
+        video = video_response['items'][0]
+        
+        # Update fields
+        if snippet_changes:
+            video['snippet'].update(snippet_changes)
+        if privacy_status:
+            video['status']['privacyStatus'] = privacy_status
+        
+        # Update video
+        update_response = self.youtube.videos().update(
+            part=','.join(parts),
+            body=video
+        ).execute(http=self._http())
+        
+        logger.info("Video updated successfully: %s", video_id)
+        
+        return {
+            'id': video_id,
+            'url': f"https://www.youtube.com/watch?v={video_id}",
+            'title': update_response.get('snippet', {}).get('title'),
+            'status': 'updated'
+        }
     
+    @_api_call("deleting video")
     def delete_video(self, video_id: str) -> bool:
         """
         Delete a video from YouTube
@@ -227,20 +669,42 @@ class YouTubeUploader:
         Returns:
             True if successful
         """
-        logger.info(f"Deleting video: {video_id}")
+        logger.info("Deleting video: %s", video_id)
         
-        try:
-            self.youtube.videos().delete(id=video_id).execute()
-            logger.info(f"Video deleted successfully: {video_id}")
-            return True
+        self.youtube.videos().delete(id=video_id).execute(http=self._http())
+        logger.info("Video deleted successfully: %s", video_id)
+        return True
+    
+    @_api_call("deleting videos")
+    def delete_videos(self, video_ids: List[str]) -> Dict[str, bool]:
+        """
+        Delete several videos, sending up to 50 deletions per batch request
+        
+        Args:
+            video_ids: YouTube video IDs
             
-        except HttpError as e:
-            logger.error(f"YouTube API error: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Error deleting video: {str(e)}")
-            raise
+        Returns:
+            Whether each deletion succeeded, keyed by video ID
+        """
+        # Video IDs double as batch request IDs, which must be unique
+        video_ids = list(dict.fromkeys(video_ids))
+        logger.info("Deleting %d videos", len(video_ids))
+        results = {}
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.error("Error deleting video %s: %s", request_id, exception)
+            results[request_id] = exception is None
+        
+        for start in range(0, len(video_ids), MAX_IDS_PER_REQUEST):
+            batch = self.youtube.new_batch_http_request(callback=on_response)
+            for video_id in video_ids[start:start + MAX_IDS_PER_REQUEST]:
+                batch.add(self.youtube.videos().delete(id=video_id), request_id=video_id)
+            batch.execute(http=self._http())
+        
+        return results
     
+    @_api_call("getting video status", retries=MAX_API_RETRIES)
     def get_video_status(self, video_id: str) -> Dict:
         """
         Get the status of an uploaded video
@@ -251,31 +715,58 @@ class YouTubeUploader:
         Returns:
             Video status information
         """
-        try:
+        response = self.youtube.videos().list(
+            part='status,snippet,contentDetails,statistics',
+            id=video_id
+        ).execute(http=self._http())
+        
+        if not response['items']:
+            raise ValueError(f"Video not found: {video_id}")
+        
+        return self._status_from_resource(response['items'][0])
+    
+    @_api_call("getting video status", retries=MAX_API_RETRIES)
+    def get_videos_status(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get the status of several uploaded videos
+        
+        videos.list takes up to 50 IDs per call, so this makes one request
+        per 50 videos instead of one per video.
+        
+        Args:
+            video_ids: YouTube video IDs
+            
+        Returns:
+            Video status information keyed by video ID; IDs that were not
+            found are left out
+        """
+        statuses = {}
+        
+        for start in range(0, len(video_ids), MAX_IDS_PER_REQUEST):
             response = self.youtube.videos().list(
                 part='status,snippet,contentDetails,statistics',
-                id=video_id
-            ).execute()
-            
-            if not response['items']:
-                raise ValueError(f"Video not found: {video_id}")
-            
-            video = response['items'][0]
+                id=','.join(video_ids[start:start + MAX_IDS_PER_REQUEST]),
+                maxResults=MAX_IDS_PER_REQUEST
+            ).execute(http=self._http())
             
-            return {
-                'id': video_id,
-                'title': video['snippet']['title'],
-                'upload_status': video['status']['uploadStatus'],
-                'privacy_status': video['status']['privacyStatus'],
-                'view_count': video['statistics'].get('viewCount', 0),
-                'like_count': video['statistics'].get('likeCount', 0),
-                'comment_count': video['statistics'].get('commentCount', 0),
-                'duration': video['contentDetails']['duration']
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting video status: {str(e)}")
-            raise
+            for video in response['items']:
+                statuses[video['id']] = self._status_from_resource(video)
+        
+        return statuses
+    
+    @staticmethod
+    def _status_from_resource(video: Dict) -> Dict:
+        """Summarize a videos.list resource"""
+        return {
+            'id': video['id'],
+            'title': video['snippet']['title'],
+            'upload_status': video['status']['uploadStatus'],
+            'privacy_status': video['status']['privacyStatus'],
+            'view_count': video['statistics'].get('viewCount', 0),
+            'like_count': video['statistics'].get('likeCount', 0),
+            'comment_count': video['statistics'].get('commentCount', 0),
+            'duration': video['contentDetails']['duration']
+        }
 
 
 def setup_youtube_credentials():
@@ -296,23 +787,41 @@ def setup_youtube_credentials():
 
 
 if __name__ == "__main__":
-    # Test the uploader
-    import sys
+    # Test the uploader; pass --json for one JSON result per line
+    json_output = '--json' in sys.argv[1:]
+    video_paths = [arg for arg in sys.argv[1:] if arg != '--json']
     
-    if len(sys.argv) < 2:
+    if not video_paths:
         setup_youtube_credentials()
         sys.exit(1)
     
-    video_path = sys.argv[1]
-    
     uploader = YouTubeUploader('client_secrets.json')
-    result = uploader.upload_video(
-        video_path=video_path,
-        title="Test Video Upload",
-        description="This is a test upload from the automated video system",
-        privacy_status="private"
-    )
-    
-    print(f"\nVideo uploaded successfully!")
-    print(f"URL: {result['url']}")
-    print(f"Video ID: {result['id']}")
+    results = uploader.upload_batch([
+        {
+            'video_path': video_path,
+            'title': "Test Video Upload",
+            'description': "This is a test upload from the automated video system",
+            'privacy_status': "private"
+        }
+        for video_path in video_paths
+    ])
+    
+    if json_output:
+        try:
+            import orjson
+            dumps = lambda result: orjson.dumps(result).decode()
+        except ImportError:
+            dumps = json.dumps
+        
+        for result in results:
+            print(dumps(result))
+        sys.exit(0 if all(result['status'] != 'failed' for result in results) else 1)
+    
+    for result in results:
+        if result['status'] == 'failed':
+            print(f"\nUpload failed: {result['error']}")
+            continue
+        
+        print(f"\nVideo uploaded successfully!")
+        print(f"URL: {result['url']}")
+        print(f"Video ID: {result['id']}")